@@ -5,11 +5,15 @@ A Python wrapper to connect to and read WiFi performance data from
 multiple ESP32 devices connected via USB.
 """
 
-from .device import ESP32Device
-from .live_view import LiveDisplay
-from .logger import PerformanceLogger
-from .manager import ESP32Manager
-from .performance import PerformanceMonitor, WiFiPerformanceData
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .device import ESP32Device
+    from .live_view import LiveDisplay
+    from .logger import PerformanceLogger
+    from .manager import ESP32Manager
+    from .performance import PerformanceMonitor, WiFiPerformanceData
 
 __version__ = "1.0.0"
 __all__ = [
@@ -20,3 +24,26 @@ __all__ = [
     "PerformanceLogger",
     "LiveDisplay",
 ]
+
+# Exports are imported on first access so the CLI only loads what it uses
+_LAZY_EXPORTS = {
+    "ESP32Device": "device",
+    "ESP32Manager": "manager",
+    "WiFiPerformanceData": "performance",
+    "PerformanceMonitor": "performance",
+    "PerformanceLogger": "logger",
+    "LiveDisplay": "live_view",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -7,15 +7,15 @@ Command-line interface for monitoring WiFi performance from ESP32 devices.
 import argparse
 import signal
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional
 
-from .device import ESP32Device
-from .live_view import LiveDisplay, SimpleDisplay
-from .logger import LogAnalyzer, PerformanceLogger
-from .manager import ESP32Manager
-from .performance import PerformanceMonitor
+from .control import DEFAULT_SOCKET_PATH
+
+# Device, display, logging and parsing modules are imported by the code
+# paths that need them, so e.g. --list-devices doesn't load the rest.
 
 
 def parse_args():
@@ -37,6 +37,9 @@ Examples:
   # Trigger a speed test on all devices
   esp32-wifi-monitor --speed-test
 
+  # Keep monitoring and accept commands from esp32-wifi-ctl
+  esp32-wifi-monitor --daemon
+
   # Analyze previously logged data
   esp32-wifi-monitor --analyze logs/wifi_perf_20240101_120000.jsonl
         """,
@@ -152,6 +155,17 @@ Examples:
         default=0,
         help="Run duration in seconds (0 = indefinite, default: 0)",
     )
+    cmd_group.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Accept commands from esp32-wifi-ctl on a control socket while monitoring",
+    )
+    cmd_group.add_argument(
+        "--socket",
+        type=str,
+        default=DEFAULT_SOCKET_PATH,
+        help=f"Control socket path for --daemon (default: {DEFAULT_SOCKET_PATH})",
+    )
 
     # Analysis
     analysis_group = parser.add_argument_group("Analysis")
@@ -173,6 +187,8 @@ Examples:
 
 def list_devices():
     """List all discovered ESP32 devices."""
+    from .device import ESP32Device
+
     print("Scanning for ESP32 devices...")
     devices = ESP32Device.discover_devices()
 
@@ -180,21 +196,25 @@ def list_devices():
         print("No ESP32 devices found.")
         return
 
-    print(f"\nFound {len(devices)} device(s):\n")
-    print(
-        f"{'Port':<20} {'Device ID':<15} {'VID:PID':<12} {'Manufacturer':<20} {'Description'}"
-    )
-    print("-" * 90)
+    out = [
+        f"\nFound {len(devices)} device(s):\n",
+        f"{'Port':<20} {'Device ID':<15} {'VID:PID':<12} {'Manufacturer':<20} {'Description'}",
+        "-" * 90,
+    ]
 
     for dev in devices:
         vid_pid = f"{dev.vid:04X}:{dev.pid:04X}" if dev.vid and dev.pid else "N/A"
         mfr = (dev.manufacturer or "N/A")[:20]
         desc = dev.description or "N/A"
-        print(f"{dev.port:<20} {dev.device_id:<15} {vid_pid:<12} {mfr:<20} {desc}")
+        out.append(f"{dev.port:<20} {dev.device_id:<15} {vid_pid:<12} {mfr:<20} {desc}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def analyze_log(filepath: str, export_path: Optional[str] = None):
     """Analyze a log file and print statistics."""
+    from .logger import LogAnalyzer
+
     filepath = Path(filepath)
 
     if not filepath.exists():
@@ -203,59 +223,71 @@ def analyze_log(filepath: str, export_path: Optional[str] = None):
 
     print(f"Analyzing: {filepath}\n")
 
-    # Load data based on format
+    # Load data based on format; records are streamed unless needed again for export
+    data: Iterable[Dict[str, Any]]
     if filepath.suffix in (".jsonl", ".gz") and ".jsonl" in filepath.name:
-        data = LogAnalyzer.load_jsonl(filepath)
+        if export_path:
+            data = LogAnalyzer.load_jsonl(filepath)
+        else:
+            data = LogAnalyzer.iter_jsonl(filepath)
     elif filepath.suffix in (".csv", ".gz") and ".csv" in filepath.name:
-        data = LogAnalyzer.load_csv(filepath)
+        if export_path:
+            data = LogAnalyzer.load_csv(filepath, fields=LogAnalyzer.ANALYSIS_FIELDS)
+        else:
+            data = LogAnalyzer.iter_csv(filepath, fields=LogAnalyzer.ANALYSIS_FIELDS)
     else:
         print(f"Error: Unsupported file format. Use .jsonl or .csv files.")
         sys.exit(1)
 
-    if not data:
-        print("No data found in file.")
-        return
-
     # Calculate and display statistics
     stats = LogAnalyzer.calculate_statistics(data)
 
-    print(f"Total Entries: {stats.get('total_entries', 0)}")
-    print(f"Devices: {', '.join(stats.get('devices', []))}")
+    if not stats:
+        print("No data found in file.")
+        return
+
+    # Build the report and write it in one go
+    out = [
+        f"Total Entries: {stats.get('total_entries', 0)}",
+        f"Devices: {', '.join(stats.get('devices', []))}",
+    ]
 
     if "time_range" in stats:
         tr = stats["time_range"]
-        print(f"\nTime Range:")
-        print(f"  Start: {tr['start']}")
-        print(f"  End: {tr['end']}")
-        print(f"  Duration: {tr['duration_seconds']:.0f} seconds")
+        out.append("\nTime Range:")
+        out.append(f"  Start: {tr['start']}")
+        out.append(f"  End: {tr['end']}")
+        out.append(f"  Duration: {tr['duration_seconds']:.0f} seconds")
 
     if "rssi" in stats:
         r = stats["rssi"]
-        print(f"\nRSSI Statistics:")
-        print(f"  Min: {r['min']} dBm")
-        print(f"  Max: {r['max']} dBm")
-        print(f"  Avg: {r['avg']:.1f} dBm")
+        out.append("\nRSSI Statistics:")
+        out.append(f"  Min: {r['min']} dBm")
+        out.append(f"  Max: {r['max']} dBm")
+        out.append(f"  Avg: {r['avg']:.1f} dBm")
 
     if "latency" in stats:
         l = stats["latency"]
-        print(f"\nLatency Statistics:")
-        print(f"  Min: {l['min']:.1f} ms")
-        print(f"  Max: {l['max']:.1f} ms")
-        print(f"  Avg: {l['avg']:.1f} ms")
+        out.append("\nLatency Statistics:")
+        out.append(f"  Min: {l['min']:.1f} ms")
+        out.append(f"  Max: {l['max']:.1f} ms")
+        out.append(f"  Avg: {l['avg']:.1f} ms")
 
     if "packet_loss" in stats:
         p = stats["packet_loss"]
-        print(f"\nPacket Loss Statistics:")
-        print(f"  Min: {p['min']:.2f}%")
-        print(f"  Max: {p['max']:.2f}%")
-        print(f"  Avg: {p['avg']:.2f}%")
+        out.append("\nPacket Loss Statistics:")
+        out.append(f"  Min: {p['min']:.2f}%")
+        out.append(f"  Max: {p['max']:.2f}%")
+        out.append(f"  Avg: {p['avg']:.2f}%")
 
     if "download_speed" in stats:
         d = stats["download_speed"]
-        print(f"\nDownload Speed Statistics:")
-        print(f"  Min: {d['min']:.2f} Mbps")
-        print(f"  Max: {d['max']:.2f} Mbps")
-        print(f"  Avg: {d['avg']:.2f} Mbps")
+        out.append("\nDownload Speed Statistics:")
+        out.append(f"  Min: {d['min']:.2f} Mbps")
+        out.append(f"  Max: {d['max']:.2f} Mbps")
+        out.append(f"  Avg: {d['avg']:.2f} Mbps")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Export if requested
     if export_path:
@@ -266,19 +298,26 @@ def analyze_log(filepath: str, export_path: Optional[str] = None):
 
 def run_monitor(args):
     """Run the main monitoring loop."""
+    from .control import ControlServer
+    from .live_view import LiveDisplay, SimpleDisplay
+    from .logger import PerformanceLogger
+    from .manager import ESP32Manager
+    from .performance import PerformanceMonitor
+
     # Initialize components
     manager = ESP32Manager(auto_reconnect=True)
     monitor = PerformanceMonitor()
     logger = None
     display = None
+    control = None
 
-    # Setup signal handlers
-    running = True
+    # Setup signal handlers. The handler only sets the event: printing from
+    # it could re-enter a print already in progress on the main thread, and
+    # a delivered signal already wakes the main loop's Event.wait().
+    stop_event = threading.Event()
 
     def signal_handler(sig, frame):
-        nonlocal running
-        print("\n\nShutting down...")
-        running = False
+        stop_event.set()
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -287,8 +326,8 @@ def run_monitor(args):
         # Connect to devices
         if args.ports:
             # Connect to specific ports
-            for port in args.ports:
-                device_id = manager.add_device(port, baud_rate=args.baud_rate)
+            results = manager.add_devices(args.ports, baud_rate=args.baud_rate)
+            for port, device_id in zip(args.ports, results):
                 if device_id:
                     print(f"Connected to {port} as {device_id}")
                 else:
@@ -312,6 +351,7 @@ def run_monitor(args):
                 file_format=args.format,
                 separate_devices=args.separate_logs,
                 max_file_size_mb=args.max_size,
+                background=True,
             )
             print(f"Logging to: {args.output_dir}/ (format: {args.format})")
 
@@ -354,6 +394,16 @@ def run_monitor(args):
         # Start reading from all devices
         manager.start_reading_all()
 
+        # Start control socket
+        if args.daemon:
+            control = ControlServer(manager, args.socket)
+            try:
+                control.start()
+                print(f"Listening for commands on {args.socket}")
+            except OSError as e:
+                print(f"Control socket unavailable: {e}")
+                control = None
+
         # Start display
         if display:
             display.start()
@@ -361,27 +411,37 @@ def run_monitor(args):
         # Calculate end time if duration specified
         end_time = None
         if args.duration > 0:
-            end_time = time.time() + args.duration
+            end_time = time.monotonic() + args.duration
 
-        # Main loop
-        while running:
-            if end_time and time.time() >= end_time:
+        # Main loop: sleep until a signal sets stop_event or the duration ends
+        while not stop_event.is_set():
+            remaining = None if end_time is None else end_time - time.monotonic()
+            if remaining is not None and remaining <= 0:
                 print(f"\nDuration of {args.duration}s reached.")
                 break
-            time.sleep(0.1)
+            if sys.platform == "win32":
+                # Lock waits aren't interrupted by Ctrl+C on Windows
+                remaining = 1.0 if remaining is None else min(remaining, 1.0)
+            stop_event.wait(remaining)
+        else:
+            print("\n\nShutting down...")
 
     finally:
         # Cleanup
+        if control:
+            control.stop()
+
         if display:
             display.stop()
 
-        if logger:
-            print(f"\nLogged {logger.entry_count} entries.")
-            logger.close()
-
+        # Stop the readers before closing the logger so no records arrive late
         manager.disconnect_all()
         print("Disconnected from all devices.")
 
+        if logger:
+            logger.close()
+            print(f"\nLogged {logger.entry_count} entries.")
+
 
 def main():
     """Main entry point."""
@@ -0,0 +1,299 @@
+"""
+Control Socket
+
+Lets a running monitor accept commands from other processes over a Unix
+domain socket, so repeated commands don't pay the CLI start-up cost.
+"""
+
+import argparse
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from .manager import ESP32Manager
+
+
+def _default_socket_path() -> str:
+    """Per-user socket path: $XDG_RUNTIME_DIR, else a private dir in the temp dir."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+        runtime_dir = os.path.join(tempfile.gettempdir(), f"esp32wifi-{user}")
+    return os.path.join(runtime_dir, "esp32wifi.sock")
+
+
+DEFAULT_SOCKET_PATH = _default_socket_path()
+
+
+def _ensure_private_dir(path: str) -> None:
+    """
+    Create path as a 0700 directory, or check that an existing one is ours.
+
+    Raises:
+        OSError: If path isn't a directory owned by this user and closed
+            to other users.
+    """
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(path)
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or (hasattr(os, "getuid") and st.st_uid != os.getuid())
+        or st.st_mode & 0o077
+    ):
+        raise OSError(f"{path} is not a private directory owned by this user")
+
+
+class ControlServer:
+    """
+    Serves JSON commands for an ESP32Manager on a Unix domain socket.
+
+    Each connection sends one JSON object terminated by a newline, e.g.
+    {"cmd": "speed_test"}, and receives one JSON response line.
+    """
+
+    def __init__(self, manager: "ESP32Manager", socket_path: str = DEFAULT_SOCKET_PATH):
+        """
+        Initialize the control server.
+
+        Args:
+            manager: Manager whose devices the commands are sent to.
+            socket_path: Filesystem path of the Unix socket.
+        """
+        self.manager = manager
+        self.socket_path = socket_path
+
+        self._socket: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self) -> None:
+        """
+        Bind the socket and start serving commands in a background thread.
+
+        Raises:
+            OSError: If Unix sockets are unsupported or another monitor
+                is already serving on socket_path.
+        """
+        if self._running:
+            return
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix domain sockets are not supported on this platform")
+
+        if self.socket_path == DEFAULT_SOCKET_PATH and not os.environ.get("XDG_RUNTIME_DIR"):
+            # The fallback lives in the shared temp dir, so it must be ours
+            _ensure_private_dir(os.path.dirname(self.socket_path))
+
+        if os.path.lexists(self.socket_path):
+            if not stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+                raise OSError(f"{self.socket_path} exists and is not a socket")
+            # Remove a stale socket left by a monitor that didn't exit cleanly
+            try:
+                send_control_command({"cmd": "ping"}, self.socket_path, timeout=1.0)
+            except OSError:
+                os.unlink(self.socket_path)
+            else:
+                raise OSError(f"A monitor is already serving on {self.socket_path}")
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Create the socket owner-only, so other users can never connect to it
+        old_umask = os.umask(0o077)
+        try:
+            sock.bind(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            os.umask(old_umask)
+        sock.listen()
+        self._socket = sock
+
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True, name="ControlServer")
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        if not self._running:
+            return
+
+        self._running = False
+        # Wake the blocking accept() so the thread sees _running is False
+        try:
+            send_control_command({"cmd": "ping"}, self.socket_path, timeout=1.0)
+        except OSError:
+            pass
+
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if self._socket:
+            self._socket.close()
+            self._socket = None
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+    def _serve(self) -> None:
+        """Background loop accepting one command per connection."""
+        sock = self._socket
+        assert sock is not None
+        while self._running:
+            try:
+                conn, _ = sock.accept()
+            except OSError:
+                break
+
+            with conn:
+                try:
+                    conn.settimeout(5.0)
+                    line = conn.makefile("rb").readline()
+                    try:
+                        request = json.loads(line)
+                    except (ValueError, TypeError) as e:
+                        response = {"ok": False, "error": f"Invalid request: {e}"}
+                    else:
+                        if not isinstance(request, dict):
+                            response = {"ok": False, "error": "Request must be a JSON object"}
+                        else:
+                            # Isolate command failures so the server thread survives
+                            try:
+                                response = self.handle_request(request)
+                            except Exception as e:
+                                response = {"ok": False, "error": f"Command failed: {e}"}
+                    conn.sendall(json.dumps(response, default=str).encode("utf-8") + b"\n")
+                except OSError:
+                    pass
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a single control request.
+
+        Args:
+            request: Decoded request, with the command name under "cmd".
+
+        Returns:
+            Response dictionary with "ok" and either "results" or "error".
+        """
+        cmd = request.get("cmd")
+        manager = self.manager
+
+        if cmd == "ping":
+            results: Any = "pong"
+        elif cmd == "report":
+            results = manager.trigger_all_performance_reports()
+        elif cmd == "speed_test":
+            results = manager.trigger_all_speed_tests()
+        elif cmd == "continuous":
+            manager.enable_all_continuous_reporting(
+                bool(request.get("enable", True)),
+                int(request.get("interval_ms", 1000)),
+            )
+            results = None
+        elif cmd == "send":
+            command = request.get("command")
+            if not command:
+                return {"ok": False, "error": "Missing 'command'"}
+            results = manager.broadcast_command(str(command))
+        elif cmd == "status":
+            from dataclasses import asdict
+
+            results = {
+                device_id: asdict(status) for device_id, status in manager.get_status().items()
+            }
+        else:
+            return {"ok": False, "error": f"Unknown command: {cmd}"}
+
+        return {"ok": True, "results": results}
+
+
+def send_control_command(
+    request: Dict[str, Any],
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    timeout: float = 5.0,
+) -> Dict[str, Any]:
+    """
+    Send a request to a running monitor's control socket.
+
+    Args:
+        request: Request dictionary, e.g. {"cmd": "speed_test"}.
+        socket_path: Path of the monitor's control socket.
+        timeout: Seconds to wait for the response.
+
+    Returns:
+        Decoded response dictionary.
+
+    Raises:
+        OSError: If the monitor can't be reached.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        line = sock.makefile("rb").readline()
+
+    if not line:
+        raise OSError("Monitor closed the connection without responding")
+    response: Dict[str, Any] = json.loads(line)
+    return response
+
+
+def main() -> None:
+    """Entry point for the esp32-wifi-ctl client."""
+    parser = argparse.ArgumentParser(
+        description="Send commands to a running esp32-wifi-monitor --daemon",
+    )
+    parser.add_argument(
+        "-s",
+        "--socket",
+        default=DEFAULT_SOCKET_PATH,
+        help=f"Control socket path (default: {DEFAULT_SOCKET_PATH})",
+    )
+    subparsers = parser.add_subparsers(dest="cmd", required=True)
+    subparsers.add_parser("report", help="Request a performance report from all devices")
+    subparsers.add_parser("speed-test", help="Trigger a speed test on all devices")
+    subparsers.add_parser("status", help="Show device connection status")
+    continuous = subparsers.add_parser("continuous", help="Enable/disable continuous reporting")
+    continuous.add_argument("state", choices=["on", "off"])
+    continuous.add_argument(
+        "--interval",
+        type=int,
+        default=1000,
+        help="Reporting interval in ms (default: 1000)",
+    )
+    send = subparsers.add_parser("send", help="Send a raw command to all devices")
+    send.add_argument("command", help="Command string, e.g. GET_NAME")
+
+    args = parser.parse_args()
+
+    request: Dict[str, Any] = {"cmd": args.cmd.replace("-", "_")}
+    if args.cmd == "continuous":
+        request["enable"] = args.state == "on"
+        request["interval_ms"] = args.interval
+    elif args.cmd == "send":
+        request["command"] = args.command
+
+    try:
+        response = send_control_command(request, args.socket)
+    except OSError as e:
+        print(f"Error: Could not reach monitor at {args.socket}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(response.get("results"), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ ESP32 Device Handler
 Manages individual serial connections to ESP32 devices.
 """
 
+import os
+import sys
 import threading
 import time
 from dataclasses import dataclass
@@ -13,8 +15,17 @@ from typing import Callable, Optional
 import serial
 from serial.tools import list_ports
 
+# Pre-encoded fixed commands
+_CMD_PERF_REPORT = b"PERF_REPORT\n"
+_CMD_SPEED_TEST = b"SPEED_TEST\n"
+_CMD_CONTINUOUS_ON = b"CONTINUOUS:ON\n"
+_CMD_CONTINUOUS_OFF = b"CONTINUOUS:OFF\n"
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class DeviceInfo:
     """Information about a connected ESP32 device."""
 
@@ -43,6 +54,13 @@ class ESP32Device:
         (0x0403, 0x6001),  # FTDI FT232
         (0x0403, 0x6015),  # FTDI FT231X
     ]
+    KNOWN_ESP32_VIDPIDS = frozenset(KNOWN_ESP32_DEVICES)
+
+    # Substrings of a port's description/manufacturer that indicate an ESP32
+    _MATCH_KEYWORDS = ("esp32", "cp210", "ch340", "ch910", "ftdi")
+
+    # Maximum bytes drained from the serial buffer per read call
+    READ_CHUNK_SIZE = 4096
 
     def __init__(
         self,
@@ -50,6 +68,7 @@ class ESP32Device:
         device_id: Optional[str] = None,
         baud_rate: int = 115200,
         timeout: float = 1.0,
+        queue_data: bool = False,
     ):
         """
         Initialize an ESP32 device connection.
@@ -59,6 +78,8 @@ class ESP32Device:
             device_id: Custom identifier for this device
             baud_rate: Serial baud rate (default: 115200)
             timeout: Read timeout in seconds
+            queue_data: Queue received lines for get_data() from the start.
+                Otherwise queuing begins on the first get_data() call.
         """
         self.port = port
         self.device_id = device_id or self._generate_device_id(port)
@@ -68,14 +89,18 @@ class ESP32Device:
         self._serial: Optional[serial.Serial] = None
         self._read_thread: Optional[threading.Thread] = None
         self._running = False
-        self._data_queue: Queue = Queue()
-        self._callbacks: list[Callable[[str, str], None]] = []
+        self._data_queue: Optional[Queue] = Queue() if queue_data else None
+        # Replaced (never mutated) under _lock so readers can iterate lock-free
+        self._callbacks: tuple[Callable[[str, str], None], ...] = ()
+        self._global_callbacks: tuple[Callable[[str, str], None], ...] = ()
+        # Global callbacks followed by this device's own, called for each line
+        self._line_callbacks: tuple[Callable[[str, str], None], ...] = ()
         self._lock = threading.Lock()
 
     @staticmethod
     def _generate_device_id(port: str) -> str:
         """Generate a device ID from the port name."""
-        return port.split("/")[-1].replace("tty.", "").replace("cu.", "")
+        return os.path.basename(port).removeprefix("tty.").removeprefix("cu.")
 
     @classmethod
     def discover_devices(cls) -> list[DeviceInfo]:
@@ -88,21 +113,12 @@ class ESP32Device:
         devices = []
         for port_info in list_ports.comports():
             # Check if this matches known ESP32 devices
-            is_esp32 = False
-            if port_info.vid and port_info.pid:
-                for vid, pid in cls.KNOWN_ESP32_DEVICES:
-                    if port_info.vid == vid and port_info.pid == pid:
-                        is_esp32 = True
-                        break
+            is_esp32 = (port_info.vid, port_info.pid) in cls.KNOWN_ESP32_VIDPIDS
 
             # Also check by description/manufacturer
-            desc_lower = (port_info.description or "").lower()
-            mfr_lower = (port_info.manufacturer or "").lower()
-            if any(
-                kw in desc_lower or kw in mfr_lower
-                for kw in ["esp32", "cp210", "ch340", "ch910", "ftdi"]
-            ):
-                is_esp32 = True
+            if not is_esp32:
+                combined = f"{port_info.description or ''} {port_info.manufacturer or ''}".lower()
+                is_esp32 = any(kw in combined for kw in cls._MATCH_KEYWORDS)
 
             if is_esp32:
                 devices.append(
@@ -132,6 +148,7 @@ class ESP32Device:
                 timeout=self.timeout,
                 write_timeout=self.timeout,
             )
+            self._enable_low_latency(self._serial)
             time.sleep(0.1)  # Allow connection to stabilize
             self._serial.reset_input_buffer()
             self._serial.reset_output_buffer()
@@ -140,6 +157,39 @@ class ESP32Device:
             print(f"[{self.device_id}] Connection failed: {e}")
             return False
 
+    def _enable_low_latency(self, ser: serial.Serial) -> None:
+        """
+        Set ASYNC_LOW_LATENCY on the tty (Linux only).
+
+        USB-serial drivers otherwise batch incoming data for up to 16 ms
+        before handing it to the reader. Drivers that don't support the
+        flag are left as they are.
+
+        Args:
+            ser: The port just opened by connect().
+        """
+        if not sys.platform.startswith("linux"):
+            return
+
+        import array
+        import fcntl
+        import termios
+
+        tiocgserial = getattr(termios, "TIOCGSERIAL", 0x541E)
+        tiocsserial = getattr(termios, "TIOCSSERIAL", 0x541F)
+        async_low_latency = 0x2000
+
+        try:
+            # struct serial_struct; 'flags' is the fifth int field
+            buf = array.array("i", [0] * 32)
+            fd = ser.fileno()
+            fcntl.ioctl(fd, tiocgserial, buf)
+            if not buf[4] & async_low_latency:
+                buf[4] |= async_low_latency
+                fcntl.ioctl(fd, tiocsserial, buf)
+        except (OSError, AttributeError, serial.SerialException):
+            pass
+
     def disconnect(self) -> None:
         """Close the connection to the device."""
         self.stop_reading()
@@ -163,30 +213,46 @@ class ESP32Device:
         )
         self._read_thread.start()
 
-    def stop_reading(self) -> None:
-        """Stop the background reading thread."""
+    def stop_reading(self, wait: bool = True) -> None:
+        """
+        Stop the background reading thread.
+
+        Args:
+            wait: Join the reader thread before returning. Pass False to only
+                signal it, e.g. when stopping many devices at once.
+        """
         self._running = False
-        if self._read_thread:
+        if wait and self._read_thread:
             self._read_thread.join(timeout=2.0)
             self._read_thread = None
 
     def _read_loop(self) -> None:
         """Background loop for reading serial data."""
-        buffer = ""
+        buffer = bytearray()
         while self._running and self.is_connected:
             try:
-                if self._serial.in_waiting > 0:
-                    data = self._serial.read(self._serial.in_waiting)
-                    buffer += data.decode("utf-8", errors="replace")
-
-                    # Process complete lines
-                    while "\n" in buffer:
-                        line, buffer = buffer.split("\n", 1)
-                        line = line.strip()
-                        if line:
-                            self._handle_line(line)
-                else:
-                    time.sleep(0.01)
+                # Block until at least one byte arrives (or the read timeout
+                # expires so _running is re-checked), then drain the rest.
+                data = self._serial.read(1)
+                if not data:
+                    continue
+                buffer += data
+                waiting = self._serial.in_waiting
+                if waiting:
+                    buffer += self._serial.read(min(waiting, self.READ_CHUNK_SIZE))
+
+                # Decode all complete lines in one call. Cutting at b"\n"
+                # never splits a multi-byte UTF-8 sequence, so no
+                # incremental decoder is needed.
+                end = buffer.rfind(b"\n")
+                if end < 0:
+                    continue
+                text = buffer[:end].decode("utf-8", errors="replace")
+                del buffer[: end + 1]
+                for line in text.split("\n"):
+                    line = line.strip()
+                    if line:
+                        self._handle_line(line)
             except serial.SerialException:
                 break
             except Exception as e:
@@ -195,14 +261,15 @@ class ESP32Device:
 
     def _handle_line(self, line: str) -> None:
         """Process a received line of data."""
-        self._data_queue.put(line)
+        data_queue = self._data_queue
+        if data_queue is not None:
+            data_queue.put(line)
 
-        with self._lock:
-            for callback in self._callbacks:
-                try:
-                    callback(self.device_id, line)
-                except Exception as e:
-                    print(f"[{self.device_id}] Callback error: {e}")
+        for callback in self._line_callbacks:
+            try:
+                callback(self.device_id, line)
+            except Exception as e:
+                print(f"[{self.device_id}] Callback error: {e}")
 
     def add_callback(self, callback: Callable[[str, str], None]) -> None:
         """
@@ -212,24 +279,48 @@ class ESP32Device:
             callback: Function(device_id, line) called for each line received.
         """
         with self._lock:
-            self._callbacks.append(callback)
+            self._callbacks = self._callbacks + (callback,)
+            self._line_callbacks = self._global_callbacks + self._callbacks
 
     def remove_callback(self, callback: Callable[[str, str], None]) -> None:
         """Remove a previously added callback."""
         with self._lock:
             if callback in self._callbacks:
-                self._callbacks.remove(callback)
+                callbacks = list(self._callbacks)
+                callbacks.remove(callback)
+                self._callbacks = tuple(callbacks)
+                self._line_callbacks = self._global_callbacks + self._callbacks
+
+    def set_global_callbacks(self, callbacks: tuple[Callable[[str, str], None], ...]) -> None:
+        """
+        Set the callbacks shared by all devices of an ESP32Manager.
+
+        They are called before this device's own callbacks and are kept
+        separately, so remove_callback() never affects them.
+
+        Args:
+            callbacks: Tuple of Function(device_id, line).
+        """
+        with self._lock:
+            self._global_callbacks = callbacks
+            self._line_callbacks = callbacks + self._callbacks
 
     def get_data(self, timeout: Optional[float] = None) -> Optional[str]:
         """
         Get the next line of data from the queue.
 
+        The queue is only filled once it is in use, so callback-only
+        consumers don't pay for it. Pass queue_data=True to the constructor
+        to also keep lines received before the first call.
+
         Args:
             timeout: Time to wait for data (None = non-blocking)
 
         Returns:
             Data line or None if no data available.
         """
+        if self._data_queue is None:
+            self._data_queue = Queue()
         try:
             return self._data_queue.get(timeout=timeout)
         except Empty:
@@ -245,13 +336,17 @@ class ESP32Device:
         Returns:
             True if command sent successfully.
         """
+        if not command.endswith("\n"):
+            command += "\n"
+        return self._send_bytes(command.encode("utf-8"))
+
+    def _send_bytes(self, payload: bytes) -> bool:
+        """Write an encoded, newline-terminated command to the device."""
         if not self.is_connected:
             return False
 
         try:
-            if not command.endswith("\n"):
-                command += "\n"
-            self._serial.write(command.encode("utf-8"))
+            self._serial.write(payload)
             self._serial.flush()
             return True
         except serial.SerialException as e:
@@ -260,11 +355,11 @@ class ESP32Device:
 
     def trigger_performance_report(self) -> bool:
         """Request a performance data report from the device."""
-        return self.send_command("PERF_REPORT")
+        return self._send_bytes(_CMD_PERF_REPORT)
 
     def trigger_speed_test(self) -> bool:
         """Trigger a WiFi speed test on the device."""
-        return self.send_command("SPEED_TEST")
+        return self._send_bytes(_CMD_SPEED_TEST)
 
     def set_report_interval(self, interval_ms: int) -> bool:
         """Set the automatic reporting interval in milliseconds."""
@@ -272,8 +367,7 @@ class ESP32Device:
 
     def enable_continuous_reporting(self, enable: bool = True) -> bool:
         """Enable or disable continuous performance reporting."""
-        cmd = "CONTINUOUS:ON" if enable else "CONTINUOUS:OFF"
-        return self.send_command(cmd)
+        return self._send_bytes(_CMD_CONTINUOUS_ON if enable else _CMD_CONTINUOUS_OFF)
 
     def __repr__(self) -> str:
         status = "connected" if self.is_connected else "disconnected"
@@ -4,13 +4,89 @@ Live Display for WiFi Performance Monitoring
 Provides real-time terminal display of performance data.
 """
 
+import os
+import re
+import shutil
 import sys
 import threading
 import time
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
-
-from .performance import WiFiPerformanceData
+from queue import Empty, SimpleQueue
+from typing import Deque, Dict, List, Optional
+
+from .performance import ConnectionStatus, WiFiPerformanceData
+
+# Synchronized output: the terminal holds the frame until it is complete.
+# Terminals without support ignore these private-mode sequences.
+_BEGIN_SYNC = "\033[?2026h"
+_END_SYNC = "\033[?2026l"
+
+# ANSI color codes
+RESET = "\033[0m"
+BOLD = "\033[1m"
+DIM = "\033[2m"
+RED = "\033[91m"
+GREEN = "\033[92m"
+YELLOW = "\033[93m"
+BLUE = "\033[94m"
+MAGENTA = "\033[95m"
+CYAN = "\033[96m"
+WHITE = "\033[97m"
+
+# Constant frame pieces, built once
+_BOX_WIDTH = 78
+_HEADER_TOP = f"{BOLD}{CYAN}╔{'═' * _BOX_WIDTH}╗{RESET}"
+_HEADER_TITLE = (
+    f"{BOLD}{CYAN}║{RESET}  {BOLD}ESP32 WiFi Performance Monitor{RESET}{' ' * 46}{CYAN}║{RESET}"
+)
+_HEADER_SEP = f"{BOLD}{CYAN}╠{'═' * _BOX_WIDTH}╣{RESET}"
+_FOOTER = f"{BOLD}{CYAN}╚{'═' * _BOX_WIDTH}╝{RESET}"
+_WAITING = f"{CYAN}║{RESET}  {DIM}Waiting for data...{RESET}{' ' * 57}{CYAN}║{RESET}"
+_EXIT_HINT = f"\n{DIM}Press Ctrl+C to exit{RESET}"
+# Left border of a device block, its opening and closing lines
+_ROW = f"{CYAN}║{RESET}  {BLUE}│{RESET}  "
+_DEVICE_START = f"{CYAN}║{RESET}  {BOLD}{BLUE}┌─ "
+_COMPACT_START = f"{CYAN}║{RESET} {BOLD}"
+_BOX_RIGHT = f"{CYAN}║{RESET}"
+# Colored "[STATUS]" tag for each connection status
+_STATUS_TAGS = {
+    status: (GREEN if status is ConnectionStatus.CONNECTED else RED)
+    + f"[{status.value.upper()}]{RESET}"
+    for status in ConnectionStatus
+}
+_DEVICE_END = f"{CYAN}║{RESET}  {BLUE}└{'─' * 70}{RESET}"
+
+# Filled graph cells
+_BLOCK_GREEN = f"{GREEN}█{RESET}"
+_BLOCK_YELLOW = f"{YELLOW}█{RESET}"
+_BLOCK_RED = f"{RED}█{RESET}"
+
+
+def _build_signal_bar(level: int) -> str:
+    """Build the 5-segment signal bar for a 0-5 level."""
+    if level >= 4:
+        block = _BLOCK_GREEN
+    elif level >= 2:
+        block = _BLOCK_YELLOW
+    else:
+        block = _BLOCK_RED
+    return "[" + block * level + f"{DIM}░{RESET}" * (5 - level) + "]"
+
+
+# Signal bar for each level, indexed by level
+_BAR_CACHE = tuple(_build_signal_bar(level) for level in range(6))
+
+# Metric coloring: bisect_right(thresholds, value) indexes the colors
+_RSSI_THRESHOLDS = (-80, -60)  # dBm
+_RSSI_COLORS = (RED, YELLOW, GREEN)
+_LATENCY_THRESHOLDS = (20, 50)  # ms
+_LOSS_THRESHOLDS = (1, 5)  # %
+_RISING_COLORS = (GREEN, YELLOW, RED)  # For metrics where lower is better
+
+# Matches the escape sequences used above, for measuring visible width
+_ANSI_RE = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
 
 
 class LiveDisplay:
@@ -23,16 +99,16 @@ class LiveDisplay:
 
     # ANSI color codes
     COLORS = {
-        "reset": "\033[0m",
-        "bold": "\033[1m",
-        "dim": "\033[2m",
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "cyan": "\033[96m",
-        "white": "\033[97m",
+        "reset": RESET,
+        "bold": BOLD,
+        "dim": DIM,
+        "red": RED,
+        "green": GREEN,
+        "yellow": YELLOW,
+        "blue": BLUE,
+        "magenta": MAGENTA,
+        "cyan": CYAN,
+        "white": WHITE,
     }
 
     def __init__(
@@ -53,31 +129,65 @@ class LiveDisplay:
         self.show_graphs = show_graphs
         self.compact_mode = compact_mode
 
+        # Filled by update() from any thread, drained by the render thread,
+        # which is the only one touching the state below
+        self._updates: SimpleQueue = SimpleQueue()
         self._device_data: Dict[str, WiFiPerformanceData] = {}
-        self._rssi_history: Dict[str, List[int]] = {}
+        self._sorted_ids: List[str] = []
+        self._body: List[str] = []
+        self._body_key: Optional[tuple] = None
+        self._status_key: Optional[tuple] = None
+        self._status_line = ""
+        self._rssi_history: Dict[str, Deque[int]] = {}
         self._history_size = 60  # Keep 60 data points for graphs
         self._running = False
+        self._stop_event = threading.Event()
         self._display_thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
         self._start_time = time.time()
 
+        # Last frame written, for redrawing only the lines that changed.
+        # None forces a full redraw.
+        self._last_lines: Optional[List[str]] = None
+        self._last_size: Optional[os.terminal_size] = None
+
     def update(self, data: WiFiPerformanceData) -> None:
         """
         Update display with new performance data.
 
+        Thread-safe and never blocks: the data is queued and applied
+        before the next frame is rendered.
+
         Args:
             data: New performance data from a device.
         """
-        with self._lock:
+        self._updates.put(data)
+
+    def _apply_updates(self) -> bool:
+        """
+        Apply all queued updates.
+
+        Returns:
+            True if any update was applied.
+        """
+        updates = self._updates
+        applied = False
+        while True:
+            try:
+                data = updates.get_nowait()
+            except Empty:
+                return applied
+
             self._device_data[data.device_id] = data
 
             # Update RSSI history for graphs
             if data.rssi is not None:
-                if data.device_id not in self._rssi_history:
-                    self._rssi_history[data.device_id] = []
-                self._rssi_history[data.device_id].append(data.rssi)
-                if len(self._rssi_history[data.device_id]) > self._history_size:
-                    self._rssi_history[data.device_id].pop(0)
+                history = self._rssi_history.get(data.device_id)
+                if history is None:
+                    history = deque(maxlen=self._history_size)
+                    self._rssi_history[data.device_id] = history
+                history.append(data.rssi)
+
+            applied = True
 
     def start(self) -> None:
         """Start the live display update loop."""
@@ -85,7 +195,9 @@ class LiveDisplay:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._start_time = time.time()
+        self._last_lines = None
         self._display_thread = threading.Thread(
             target=self._display_loop, daemon=True, name="LiveDisplay"
         )
@@ -94,63 +206,139 @@ class LiveDisplay:
     def stop(self) -> None:
         """Stop the live display."""
         self._running = False
+        self._stop_event.set()
         if self._display_thread:
             self._display_thread.join(timeout=2.0)
             self._display_thread = None
 
     def _display_loop(self) -> None:
         """Background loop for display updates."""
+        # Waiting on the event rather than sleeping lets stop() return at once
         while self._running:
             self._render()
-            time.sleep(self.refresh_rate)
-
-    def _clear_screen(self) -> None:
-        """Clear terminal screen."""
-        sys.stdout.write("\033[2J\033[H")
-        sys.stdout.flush()
+            if self._stop_event.wait(self.refresh_rate):
+                break
 
     def _render(self) -> None:
         """Render the display."""
-        self._clear_screen()
-
-        c = self.COLORS
-        uptime = time.time() - self._start_time
+        # Device rows are only rebuilt after an update or a view change
+        updated = self._apply_updates()
+        body_key = (self.compact_mode, self.show_graphs)
+        if updated or self._body_key != body_key:
+            self._body_key = body_key
+            self._body = self._render_body()
+
+        # The status line only changes once a second or with the device count
+        now = time.time()
+        uptime = now - self._start_time
+        status_key = (int(now), int(uptime), len(self._sorted_ids))
+        if status_key != self._status_key:
+            self._status_key = status_key
+            self._status_line = f"{BOLD}{CYAN}║{RESET}  {DIM}Running: {self._format_duration(uptime)} | Devices: {len(self._sorted_ids)} | {datetime.fromtimestamp(now).strftime('%H:%M:%S')}{RESET}      {CYAN}║{RESET}"
+
+        # Build the whole frame and write it with a single call
+        out: List[str] = []
 
         # Header
-        print(
-            f"{c['bold']}{c['cyan']}╔══════════════════════════════════════════════════════════════════════════════╗{c['reset']}"
-        )
-        print(
-            f"{c['bold']}{c['cyan']}║{c['reset']}  {c['bold']}ESP32 WiFi Performance Monitor{c['reset']}                                              {c['cyan']}║{c['reset']}"
-        )
-        print(
-            f"{c['bold']}{c['cyan']}║{c['reset']}  {c['dim']}Running: {self._format_duration(uptime)} | Devices: {len(self._device_data)} | {datetime.now().strftime('%H:%M:%S')}{c['reset']}      {c['cyan']}║{c['reset']}"
-        )
-        print(
-            f"{c['bold']}{c['cyan']}╠══════════════════════════════════════════════════════════════════════════════╣{c['reset']}"
-        )
+        out.append(_HEADER_TOP)
+        out.append(_HEADER_TITLE)
+        out.append(self._status_line)
+        out.append(_HEADER_SEP)
+        out.extend(self._body)
+        out.append(_FOOTER)
+        out.append(_EXIT_HINT)
+
+        output = self._frame_update("\n".join(out).split("\n"))
+        if output:
+            self._write(_BEGIN_SYNC + output + _END_SYNC)
+
+    @staticmethod
+    def _write(text: str) -> None:
+        """
+        Write a frame to stdout and flush it.
 
-        with self._lock:
-            if not self._device_data:
-                print(
-                    f"{c['cyan']}║{c['reset']}  {c['dim']}Waiting for data...{c['reset']}                                                         {c['cyan']}║{c['reset']}"
-                )
-            else:
-                for device_id, data in sorted(self._device_data.items()):
-                    if self.compact_mode:
-                        self._render_compact(device_id, data)
-                    else:
-                        self._render_detailed(device_id, data)
-
-        print(
-            f"{c['bold']}{c['cyan']}╚══════════════════════════════════════════════════════════════════════════════╝{c['reset']}"
-        )
-        print(f"\n{c['dim']}Press Ctrl+C to exit{c['reset']}")
+        The frame is encoded once and written to the underlying binary
+        buffer, skipping the text layer; streams without one (e.g. StringIO)
+        are written to directly.
+        """
+        stdout = sys.stdout
+        buffer = getattr(stdout, "buffer", None)
+        if buffer is None:
+            stdout.write(text)
+            stdout.flush()
+            return
+
+        stdout.flush()  # Keep ordering with anything printed before
+        buffer.write(text.encode(stdout.encoding or "utf-8", stdout.errors or "strict"))
+        buffer.flush()
+
+    def _render_body(self) -> List[str]:
+        """Build the device rows from the current data."""
+        devices = self._device_data
+        histories = self._rssi_history
+
+        # Devices are never removed, so the order only changes with the count
+        if len(devices) != len(self._sorted_ids):
+            self._sorted_ids = sorted(devices)
+
+        out: List[str] = []
+        if not devices:
+            out.append(_WAITING)
+        else:
+            for device_id in self._sorted_ids:
+                data = devices[device_id]
+                if self.compact_mode:
+                    self._render_compact(out, device_id, data)
+                else:
+                    history = histories.get(device_id)
+                    self._render_detailed(out, device_id, data, list(history) if history else None)
+        return out
+
+    def _frame_update(self, lines: List[str]) -> str:
+        """
+        Build the terminal output that replaces the last frame with lines.
 
-    def _render_compact(self, device_id: str, data: WiFiPerformanceData) -> None:
-        """Render compact single-line view for a device."""
-        c = self.COLORS
+        Only changed lines are rewritten in place. The whole frame is
+        rewritten when the line count or terminal size changes; the screen
+        is only cleared first when the frame doesn't map one line per row
+        (too tall, or a line would wrap).
 
+        Args:
+            lines: Screen lines of the new frame.
+
+        Returns:
+            Escape sequences and text to write; empty if nothing changed.
+        """
+        size = shutil.get_terminal_size()
+        last = self._last_lines
+
+        if last is not None and len(last) == len(lines) and size == self._last_size:
+            parts = []
+            for row, (line, old) in enumerate(zip(lines, last), 1):
+                if line != old:
+                    if len(_ANSI_RE.sub("", line)) > size.columns:
+                        break
+                    parts.append(f"\033[{row};1H\033[2K{line}")
+            else:
+                self._last_lines = lines
+                if parts:
+                    # Leave the cursor below the frame, as after a full redraw
+                    parts.append(f"\033[{len(lines) + 1};1H")
+                return "".join(parts)
+
+        fits = len(lines) < size.lines and all(
+            len(_ANSI_RE.sub("", line)) <= size.columns for line in lines
+        )
+        self._last_lines = lines if fits else None
+        self._last_size = size
+        if not fits:
+            return "\033[2J\033[H" + "\n".join(lines) + "\n"
+        # Overwrite from the top, erasing each line as it is rewritten and
+        # everything below the frame, rather than blanking the whole screen
+        return "\033[H\033[2K" + "\n\033[2K".join(lines) + "\n\033[J"
+
+    def _render_compact(self, out: List[str], device_id: str, data: WiFiPerformanceData) -> None:
+        """Append compact single-line view for a device to out."""
         rssi_str = f"{data.rssi:4d} dBm" if data.rssi else "   N/A  "
         rssi_color = self._get_rssi_color(data.rssi)
 
@@ -158,32 +346,32 @@ class LiveDisplay:
         latency = f"{data.latency_avg:6.1f}ms" if data.latency_avg else "    N/A "
         loss = f"{data.packet_loss:5.1f}%" if data.packet_loss is not None else "  N/A "
 
-        line = f"{c['cyan']}║{c['reset']} {c['bold']}{device_id:12s}{c['reset']} │ {ssid} │ {rssi_color}{rssi_str}{c['reset']} │ {latency} │ {loss} {c['cyan']}║{c['reset']}"
-        print(line)
-
-    def _render_detailed(self, device_id: str, data: WiFiPerformanceData) -> None:
-        """Render detailed multi-line view for a device."""
-        c = self.COLORS
+        out.append(
+            f"{_COMPACT_START}{device_id:12s}{RESET} │ {ssid} │ {rssi_color}{rssi_str}{RESET} │ {latency} │ {loss} {_BOX_RIGHT}"
+        )
 
+    def _render_detailed(
+        self,
+        out: List[str],
+        device_id: str,
+        data: WiFiPerformanceData,
+        history: Optional[List[int]] = None,
+    ) -> None:
+        """Append detailed multi-line view for a device to out."""
         # Device header
-        status_color = c["green"] if data.status.value == "connected" else c["red"]
-        print(
-            f"{c['cyan']}║{c['reset']}  {c['bold']}{c['blue']}┌─ {device_id}{c['reset']} {status_color}[{data.status.value.upper()}]{c['reset']}"
-        )
+        out.append(f"{_DEVICE_START}{device_id}{RESET} {_STATUS_TAGS[data.status]}")
 
         # Connection info
         ssid = data.ssid or "N/A"
         channel = data.channel or "N/A"
-        print(
-            f"{c['cyan']}║{c['reset']}  {c['blue']}│{c['reset']}  SSID: {c['white']}{ssid}{c['reset']} | Channel: {channel}"
-        )
+        out.append(f"{_ROW}SSID: {WHITE}{ssid}{RESET} | Channel: {channel}")
 
         # Signal quality
         rssi_color = self._get_rssi_color(data.rssi)
         rssi_str = f"{data.rssi} dBm" if data.rssi else "N/A"
         signal_bar = self._render_signal_bar(data.rssi) if data.rssi else ""
-        print(
-            f"{c['cyan']}║{c['reset']}  {c['blue']}│{c['reset']}  Signal: {rssi_color}{rssi_str:10s}{c['reset']} {signal_bar} ({data.signal_strength})"
+        out.append(
+            f"{_ROW}Signal: {rssi_color}{rssi_str:10s}{RESET} {signal_bar} ({data.signal_strength})"
         )
 
         # Throughput
@@ -191,70 +379,45 @@ class LiveDisplay:
             tx = f"{data.tx_rate:.1f}" if data.tx_rate else "N/A"
             rx = f"{data.rx_rate:.1f}" if data.rx_rate else "N/A"
             link = f"{data.link_speed}" if data.link_speed else "N/A"
-            print(
-                f"{c['cyan']}║{c['reset']}  {c['blue']}│{c['reset']}  TX: {tx} Kbps | RX: {rx} Kbps | Link: {link} Mbps"
-            )
+            out.append(f"{_ROW}TX: {tx} Kbps | RX: {rx} Kbps | Link: {link} Mbps")
 
         # Latency
         if data.latency_avg is not None:
             lat_color = self._get_latency_color(data.latency_avg)
             jitter = f"{data.jitter:.1f}ms" if data.jitter else "N/A"
-            print(
-                f"{c['cyan']}║{c['reset']}  {c['blue']}│{c['reset']}  Latency: {lat_color}{data.latency_avg:.1f}ms{c['reset']} (min: {data.latency_min or 0:.1f}, max: {data.latency_max or 0:.1f}) | Jitter: {jitter}"
+            out.append(
+                f"{_ROW}Latency: {lat_color}{data.latency_avg:.1f}ms{RESET} (min: {data.latency_min or 0:.1f}, max: {data.latency_max or 0:.1f}) | Jitter: {jitter}"
             )
 
         # Packet stats
         if data.packet_loss is not None:
-            loss_color = (
-                c["green"]
-                if data.packet_loss < 1
-                else c["yellow"] if data.packet_loss < 5 else c["red"]
-            )
-            print(
-                f"{c['cyan']}║{c['reset']}  {c['blue']}│{c['reset']}  Packet Loss: {loss_color}{data.packet_loss:.2f}%{c['reset']} | TX Retries: {data.tx_retries or 0}"
+            loss_color = _RISING_COLORS[bisect_right(_LOSS_THRESHOLDS, data.packet_loss)]
+            out.append(
+                f"{_ROW}Packet Loss: {loss_color}{data.packet_loss:.2f}%{RESET} | TX Retries: {data.tx_retries or 0}"
             )
 
         # Speed test results
         if data.download_speed or data.upload_speed:
             dl = f"{data.download_speed:.2f} Mbps" if data.download_speed else "N/A"
             ul = f"{data.upload_speed:.2f} Mbps" if data.upload_speed else "N/A"
-            print(
-                f"{c['cyan']}║{c['reset']}  {c['blue']}│{c['reset']}  Download: {c['green']}{dl}{c['reset']} | Upload: {c['blue']}{ul}{c['reset']}"
-            )
+            out.append(f"{_ROW}Download: {GREEN}{dl}{RESET} | Upload: {BLUE}{ul}{RESET}")
 
         # RSSI graph
-        if self.show_graphs and device_id in self._rssi_history:
-            self._render_rssi_graph(device_id)
+        if self.show_graphs and history:
+            self._render_rssi_graph(out, history)
 
-        print(f"{c['cyan']}║{c['reset']}  {c['blue']}└{'─' * 70}{c['reset']}")
+        out.append(_DEVICE_END)
 
     def _render_signal_bar(self, rssi: Optional[int]) -> str:
         """Render ASCII signal strength bar."""
         if rssi is None:
             return ""
 
-        c = self.COLORS
         # Normalize RSSI to 0-5 scale (-90 to -40 dBm range)
-        normalized = max(0, min(5, (rssi + 90) // 10))
-
-        bar = ""
-        for i in range(5):
-            if i < normalized:
-                if normalized >= 4:
-                    bar += f"{c['green']}█{c['reset']}"
-                elif normalized >= 2:
-                    bar += f"{c['yellow']}█{c['reset']}"
-                else:
-                    bar += f"{c['red']}█{c['reset']}"
-            else:
-                bar += f"{c['dim']}░{c['reset']}"
-
-        return f"[{bar}]"
+        return _BAR_CACHE[max(0, min(5, (rssi + 90) // 10))]
 
-    def _render_rssi_graph(self, device_id: str) -> str:
-        """Render ASCII RSSI history graph."""
-        c = self.COLORS
-        history = self._rssi_history.get(device_id, [])
+    def _render_rssi_graph(self, out: List[str], history: List[int]) -> None:
+        """Append ASCII RSSI history graph to out."""
         if len(history) < 2:
             return
 
@@ -269,54 +432,37 @@ class LiveDisplay:
         step = max(1, len(history) // width)
         samples = history[::step][-width:]
 
-        # Build graph
-        graph_lines = [["░"] * width for _ in range(height)]
-
-        for i, rssi in enumerate(samples):
-            if rssi is not None:
-                normalized = (rssi - min_rssi) / (max_rssi - min_rssi)
-                bar_height = int(normalized * height)
-                for h in range(min(bar_height, height)):
-                    if normalized > 0.7:
-                        graph_lines[height - 1 - h][i] = f"{c['green']}█{c['reset']}"
-                    elif normalized > 0.4:
-                        graph_lines[height - 1 - h][i] = f"{c['yellow']}█{c['reset']}"
-                    else:
-                        graph_lines[height - 1 - h][i] = f"{c['red']}█{c['reset']}"
-
-        print(
-            f"{c['cyan']}║{c['reset']}  {c['blue']}│{c['reset']}  {c['dim']}RSSI History:{c['reset']}"
-        )
-        for line in graph_lines:
-            print(
-                f"{c['cyan']}║{c['reset']}  {c['blue']}│{c['reset']}    {''.join(line)}"
-            )
+        # Height and colored block for each sample column
+        columns = []
+        for rssi in samples:
+            if rssi is None:
+                columns.append((0, ""))
+                continue
+            normalized = (rssi - min_rssi) / (max_rssi - min_rssi)
+            if normalized > 0.7:
+                block = _BLOCK_GREEN
+            elif normalized > 0.4:
+                block = _BLOCK_YELLOW
+            else:
+                block = _BLOCK_RED
+            columns.append((int(normalized * height), block))
+        padding = "░" * (width - len(columns))
+
+        out.append(f"{_ROW}{DIM}RSSI History:{RESET}")
+        # Top row first; a column is filled at every level up to its height
+        for level in range(height, 0, -1):
+            row = "".join(block if bar_height >= level else "░" for bar_height, block in columns)
+            out.append(f"{_ROW}  {row}{padding}")
 
     def _get_rssi_color(self, rssi: Optional[int]) -> str:
         """Get color code for RSSI value."""
-        c = self.COLORS
         if rssi is None:
-            return c["dim"]
-        if rssi >= -50:
-            return c["green"]
-        elif rssi >= -60:
-            return c["green"]
-        elif rssi >= -70:
-            return c["yellow"]
-        elif rssi >= -80:
-            return c["yellow"]
-        else:
-            return c["red"]
+            return DIM
+        return _RSSI_COLORS[bisect_right(_RSSI_THRESHOLDS, rssi)]
 
     def _get_latency_color(self, latency: float) -> str:
         """Get color code for latency value."""
-        c = self.COLORS
-        if latency < 20:
-            return c["green"]
-        elif latency < 50:
-            return c["yellow"]
-        else:
-            return c["red"]
+        return _RISING_COLORS[bisect_right(_LATENCY_THRESHOLDS, latency)]
 
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human readable format."""
@@ -378,4 +524,5 @@ class SimpleDisplay:
         if data.rx_rate is not None:
             parts.append(f"RX:{data.rx_rate:.0f}Kbps")
 
-        print(" | ".join(parts))
+        # One write per record; stdout is already block-buffered when piped
+        sys.stdout.write(" | ".join(parts) + "\n")
@@ -6,13 +6,77 @@ Provides logging capabilities for WiFi performance data analysis.
 
 import csv
 import gzip
+import io
 import json
+import queue
+import shutil
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TextIO, Union
-
-from .performance import WiFiPerformanceData
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .performance import WiFiPerformanceData, _isoformat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Both accept bytes, so log files can be read in binary mode either way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a JSONL record as bytes, so the file is opened in binary mode."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # orjson only encodes integers up to 64 bits
+    return json.dumps(obj).encode("utf-8")
+
+
+# Log files are flushed every flush_every records or flush_interval seconds
+# rather than per write
+_FILE_BUFFER_SIZE = 1 << 20
+
+# Chunk size used when copying a rotated file into its gzip archive
+_COMPRESS_CHUNK_SIZE = 1 << 20
+
+# Maximum records the background writer takes off the queue per lock hold
+_WRITER_BATCH_SIZE = 256
+
+# Optional WiFiPerformanceData fields written to JSONL, omitted when None
+_JSONL_OPTIONAL_FIELDS = (
+    "ssid",
+    "bssid",
+    "channel",
+    "rssi",
+    "snr",
+    "noise_floor",
+    "tx_rate",
+    "rx_rate",
+    "link_speed",
+    "tx_packets",
+    "rx_packets",
+    "tx_bytes",
+    "rx_bytes",
+    "tx_errors",
+    "rx_errors",
+    "tx_retries",
+    "packet_loss",
+    "latency_min",
+    "latency_avg",
+    "latency_max",
+    "jitter",
+    "download_speed",
+    "upload_speed",
+    "free_heap",
+    "uptime",
+    "cpu_freq",
+)
 
 
 class PerformanceLogger:
@@ -28,6 +92,7 @@ class PerformanceLogger:
     - Automatic file rotation by size or time
     - Gzip compression for archived logs
     - Per-device or combined logging
+    - Optional background writer thread, so log() never blocks on file I/O
     """
 
     def __init__(
@@ -38,6 +103,11 @@ class PerformanceLogger:
         max_file_size_mb: float = 100.0,
         rotate_interval_hours: Optional[float] = None,
         compress_rotated: bool = True,
+        compress_level: int = 1,
+        background: bool = False,
+        flush_every: int = 500,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 0,
     ):
         """
         Initialize the performance logger.
@@ -49,24 +119,70 @@ class PerformanceLogger:
             max_file_size_mb: Rotate files when they reach this size.
             rotate_interval_hours: Rotate files after this many hours.
             compress_rotated: Gzip compress rotated files.
+            compress_level: Gzip level for rotated files (1 = fastest, 9 = smallest).
+                Rotation runs on the write path, so the default favours
+                speed over archive size.
+            background: Queue records and write them from a dedicated thread,
+                so callers (e.g. serial reader callbacks) never wait on
+                formatting, rotation or compression. close() drains the queue.
+            flush_every: Flush log files to disk after this many records
+                (1 = every record). Files are always flushed on close().
+            flush_interval: Also flush once this many seconds have passed
+                since the last flush, so a slow trickle of records still
+                reaches disk. The background writer flushes when idle;
+                without it the check runs on each log() call.
+            max_queue_size: With background=True, hold at most this many
+                pending records and drop new ones while the queue is full
+                (see dropped_count). 0 means unbounded.
         """
         self.output_dir = Path(output_dir)
         self.file_format = file_format.lower()
         self.separate_devices = separate_devices
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
         self.rotate_interval_hours = rotate_interval_hours
+        self._rotate_interval_s = rotate_interval_hours * 3600 if rotate_interval_hours else None
         self.compress_rotated = compress_rotated
+        self.compress_level = compress_level
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
 
-        self._files: Dict[str, TextIO] = {}
+        self._files: Dict[str, IO] = {}
         self._file_paths: Dict[str, Path] = {}
-        self._file_start_times: Dict[str, datetime] = {}
+        # time.monotonic() at which each file was opened
+        self._file_start_times: Dict[str, float] = {}
+        # Bytes (characters for text formats) written to each open file, so
+        # size-based rotation doesn't need a stat() per record
+        self._bytes_written: Dict[str, int] = {}
         self._csv_writers: Dict[str, csv.DictWriter] = {}
+        # CSV rows are formatted here first so each batch is one file write
+        self._csv_buffer = io.StringIO(newline="")
         self._lock = threading.Lock()
         self._entry_count = 0
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._dropped_count = 0
+        self._drop_lock = threading.Lock()
+        # Rotated files are gzipped off the write path; created on first use
+        self._compress_pool: Optional[ThreadPoolExecutor] = None
+        # (whole second, formatted timestamp) last used by _format_text
+        self._ts_cache = (0, "")
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        self._queue: Optional[Union[queue.SimpleQueue, queue.Queue]] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._bounded = background and max_queue_size > 0
+        if background:
+            q: Union[queue.SimpleQueue, queue.Queue] = (
+                queue.Queue(max_queue_size) if self._bounded else queue.SimpleQueue()
+            )
+            self._queue = q
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, args=(q,), daemon=True, name="PerformanceLogger"
+            )
+            self._writer_thread.start()
+
     def log(self, data: WiFiPerformanceData) -> None:
         """
         Log a performance data point.
@@ -74,9 +190,77 @@ class PerformanceLogger:
         Args:
             data: Performance data to log.
         """
-        with self._lock:
-            file_key = data.device_id if self.separate_devices else "_combined"
+        if self._queue is None:
+            with self._lock:
+                self._write_records([data])
+        elif self._bounded:
+            try:
+                self._queue.put_nowait(data)
+            except queue.Full:
+                with self._drop_lock:
+                    self._dropped_count += 1
+        else:
+            self._queue.put(data)
+
+    def _writer_loop(self, q: Union[queue.SimpleQueue, queue.Queue]) -> None:
+        """
+        Background loop writing queued records until the None sentinel.
+
+        Blocks for one record, then drains whatever else is already queued
+        (up to _WRITER_BATCH_SIZE) and writes the batch under one lock hold.
+        While records are waiting to be flushed, the wait for the next one is
+        bounded so they are flushed within flush_interval. Write errors are
+        reported and the batch skipped, so the thread keeps draining the
+        queue.
+        """
+        while True:
+            try:
+                if self._unflushed:
+                    timeout = self._last_flush + self.flush_interval - time.monotonic()
+                    batch = [q.get(timeout=max(timeout, 0.0))]
+                else:
+                    batch = [q.get()]
+            except queue.Empty:
+                try:
+                    with self._lock:
+                        self._flush_files()
+                except Exception as e:
+                    print(f"Failed to flush log files: {e}")
+                continue
+
+            try:
+                while len(batch) < _WRITER_BATCH_SIZE:
+                    batch.append(q.get_nowait())
+            except queue.Empty:
+                pass
+
+            stop = None in batch
+            if stop:
+                batch = batch[: batch.index(None)]
+            if batch:
+                try:
+                    with self._lock:
+                        self._write_records(batch)
+                except Exception as e:
+                    print(f"Failed to write {len(batch)} log records: {e}")
+            if stop:
+                return
+
+    def _write_records(self, records: List[WiFiPerformanceData]) -> None:
+        """
+        Write records to their log files. Caller must hold _lock.
 
+        Records are grouped by file and each group is serialized into a
+        single write() call. Rotation is checked once per group.
+        """
+        if self.separate_devices:
+            groups: Dict[str, List[WiFiPerformanceData]] = {}
+            for data in records:
+                groups.setdefault(data.device_id, []).append(data)
+        else:
+            groups = {"_combined": records}
+
+        for file_key, group in groups.items():
             # Check if we need to rotate
             self._check_rotation(file_key)
 
@@ -86,16 +270,30 @@ class PerformanceLogger:
 
             # Write data in appropriate format
             if self.file_format == "jsonl":
-                self._write_jsonl(file_key, data)
+                written = self._write_jsonl(file_key, group)
             elif self.file_format == "csv":
-                self._write_csv(file_key, data)
+                written = self._write_csv(file_key, group)
             else:
-                self._write_text(file_key, data)
+                written = self._write_text(file_key, group)
+            self._bytes_written[file_key] += written
+
+            self._entry_count += len(group)
+            self._unflushed += len(group)
 
-            self._entry_count += 1
+        if (
+            self._unflushed >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush_files()
 
     def _generate_filename(self, file_key: str) -> str:
-        """Generate a filename with timestamp."""
+        """
+        Generate a filename with timestamp.
+
+        A counter is appended if a file (or its rotated .gz) already exists
+        for the same second, so a fast rotation never reopens a file that is
+        still queued for compression.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         if file_key == "_combined":
@@ -103,7 +301,14 @@ class PerformanceLogger:
         else:
             base = f"wifi_perf_{file_key}_{timestamp}"
 
-        return f"{base}.{self.file_format}"
+        filename = f"{base}.{self.file_format}"
+        counter = 0
+        while (self.output_dir / filename).exists() or (
+            self.output_dir / f"{filename}.gz"
+        ).exists():
+            counter += 1
+            filename = f"{base}_{counter}.{self.file_format}"
+        return filename
 
     def _open_file(self, file_key: str) -> None:
         """Open a new log file."""
@@ -111,35 +316,31 @@ class PerformanceLogger:
         filepath = self.output_dir / filename
 
         self._file_paths[file_key] = filepath
-        self._file_start_times[file_key] = datetime.now()
+        self._file_start_times[file_key] = time.monotonic()
+        self._bytes_written[file_key] = 0
 
         if self.file_format == "csv":
-            self._files[file_key] = open(filepath, "w", newline="", encoding="utf-8")
-            self._csv_writers[file_key] = None  # Will be created on first write
+            self._files[file_key] = open(
+                filepath, "w", newline="", encoding="utf-8", buffering=_FILE_BUFFER_SIZE
+            )
+            self._csv_writers.pop(file_key, None)  # Will be created on first write
+        elif self.file_format == "jsonl":
+            self._files[file_key] = open(filepath, "wb", buffering=_FILE_BUFFER_SIZE)
         else:
-            self._files[file_key] = open(filepath, "w", encoding="utf-8")
+            self._files[file_key] = open(
+                filepath, "w", encoding="utf-8", buffering=_FILE_BUFFER_SIZE
+            )
 
     def _check_rotation(self, file_key: str) -> None:
         """Check if file rotation is needed."""
         if file_key not in self._files:
             return
 
-        should_rotate = False
-
-        # Check size
-        filepath = self._file_paths[file_key]
-        if filepath.exists() and filepath.stat().st_size >= self.max_file_size_bytes:
-            should_rotate = True
-
-        # Check time
-        if self.rotate_interval_hours:
-            start_time = self._file_start_times.get(file_key)
-            if start_time:
-                hours_elapsed = (datetime.now() - start_time).total_seconds() / 3600
-                if hours_elapsed >= self.rotate_interval_hours:
-                    should_rotate = True
-
-        if should_rotate:
+        # Check size, then time
+        if self._bytes_written[file_key] >= self.max_file_size_bytes or (
+            self._rotate_interval_s is not None
+            and time.monotonic() - self._file_start_times[file_key] >= self._rotate_interval_s
+        ):
             self._rotate_file(file_key)
 
     def _rotate_file(self, file_key: str) -> None:
@@ -151,86 +352,166 @@ class PerformanceLogger:
             if file_key in self._csv_writers:
                 del self._csv_writers[file_key]
 
-            # Compress old file if enabled
+            # Compress old file if enabled, without holding up writers
             if self.compress_rotated:
                 old_path = self._file_paths[file_key]
                 if old_path.exists():
-                    self._compress_file(old_path)
+                    if self._compress_pool is None:
+                        self._compress_pool = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="PerformanceLoggerGzip"
+                        )
+                    self._compress_pool.submit(self._compress_file, old_path)
 
     def _compress_file(self, filepath: Path) -> None:
         """Compress a file using gzip."""
         gz_path = filepath.with_suffix(filepath.suffix + ".gz")
 
-        with open(filepath, "rb") as f_in:
-            with gzip.open(gz_path, "wb") as f_out:
-                f_out.writelines(f_in)
+        try:
+            with open(filepath, "rb") as f_in:
+                with gzip.open(gz_path, "wb", compresslevel=self.compress_level) as f_out:
+                    shutil.copyfileobj(f_in, f_out, _COMPRESS_CHUNK_SIZE)
+        except OSError as e:
+            print(f"Failed to compress {filepath}: {e}")
+            return
 
         filepath.unlink()  # Remove original
 
-    def _write_jsonl(self, file_key: str, data: WiFiPerformanceData) -> None:
-        """Write data in JSON Lines format."""
-        f = self._files[file_key]
-        json.dump(data.to_dict(), f)
-        f.write("\n")
-        f.flush()
+    def _write_jsonl(self, file_key: str, records: List[WiFiPerformanceData]) -> int:
+        """Write records in JSON Lines format. Returns the bytes written."""
+        lines = [_json_dumps(self._jsonl_record(data)) for data in records]
+        lines.append(b"")
+        return self._files[file_key].write(b"\n".join(lines))
+
+    @staticmethod
+    def _jsonl_record(data: WiFiPerformanceData) -> Dict[str, Any]:
+        """
+        Build the JSON Lines record for a data point.
+
+        Fields are read straight off the dataclass instead of going through
+        to_dict(), and unset (None) metrics are left out of the record.
+        LogAnalyzer reads missing keys the same as null.
+        """
+        record = {
+            "device_id": data.device_id,
+            "timestamp": data.timestamp,
+            "datetime": _isoformat(data.timestamp),
+            "status": data.status.value,
+            "signal_strength": data.signal_strength,
+        }
+        for name in _JSONL_OPTIONAL_FIELDS:
+            value = getattr(data, name)
+            if value is not None:
+                record[name] = value
+        return record
 
-    def _write_csv(self, file_key: str, data: WiFiPerformanceData) -> None:
-        """Write data in CSV format."""
-        f = self._files[file_key]
-        data_dict = data.to_dict()
+    def _write_csv(self, file_key: str, records: List[WiFiPerformanceData]) -> int:
+        """Write records in CSV format. Returns the characters written."""
+        rows = [data.to_dict() for data in records]
 
         # Create writer with header on first write
-        if self._csv_writers.get(file_key) is None:
-            self._csv_writers[file_key] = csv.DictWriter(
-                f,
-                fieldnames=list(data_dict.keys()),
+        writer = self._csv_writers.get(file_key)
+        new_writer = writer is None
+        if writer is None:
+            writer = self._csv_writers[file_key] = csv.DictWriter(
+                self._csv_buffer,
+                fieldnames=list(rows[0].keys()),
                 extrasaction="ignore",
             )
-            self._csv_writers[file_key].writeheader()
-
-        self._csv_writers[file_key].writerow(data_dict)
-        f.flush()
-
-    def _write_text(self, file_key: str, data: WiFiPerformanceData) -> None:
-        """Write data in plain text format."""
-        f = self._files[file_key]
-
-        timestamp = data.datetime.strftime("%Y-%m-%d %H:%M:%S")
-        parts = [timestamp, f"[{data.device_id}]"]
-
+            writer.writeheader()
+
+        writer.writerows(rows)
+        text = self._csv_buffer.getvalue()
+        self._csv_buffer.seek(0)
+        self._csv_buffer.truncate()
+        try:
+            return self._files[file_key].write(text)
+        except Exception:
+            if new_writer:
+                # The header went with the failed rows, so write it again next time
+                del self._csv_writers[file_key]
+            raise
+
+    def _write_text(self, file_key: str, records: List[WiFiPerformanceData]) -> int:
+        """Write records in plain text format. Returns the characters written."""
+        lines = [self._format_text(data) for data in records]
+        lines.append("")
+        return self._files[file_key].write("\n".join(lines))
+
+    def _format_text(self, data: WiFiPerformanceData) -> str:
+        """Format a data point as a plain text log line."""
+        # strftime only runs once per wall-clock second
+        second = int(data.timestamp)
+        if second != self._ts_cache[0]:
+            self._ts_cache = (
+                second,
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)),
+            )
+        timestamp = self._ts_cache[1]
+        # Fields are appended in place (CPython extends the string without
+        # copying), which beats collecting parts in a list and joining them
+        line = f"{timestamp} | [{data.device_id}]"
         if data.ssid:
-            parts.append(f"SSID:{data.ssid}")
+            line += f" | SSID:{data.ssid}"
         if data.rssi is not None:
-            parts.append(f"RSSI:{data.rssi}dBm")
+            line += f" | RSSI:{data.rssi}dBm"
         if data.latency_avg is not None:
-            parts.append(f"Latency:{data.latency_avg:.1f}ms")
+            line += f" | Latency:{data.latency_avg:.1f}ms"
         if data.packet_loss is not None:
-            parts.append(f"Loss:{data.packet_loss:.1f}%")
+            line += f" | Loss:{data.packet_loss:.1f}%"
         if data.tx_rate is not None:
-            parts.append(f"TX:{data.tx_rate:.0f}Kbps")
+            line += f" | TX:{data.tx_rate:.0f}Kbps"
         if data.rx_rate is not None:
-            parts.append(f"RX:{data.rx_rate:.0f}Kbps")
+            line += f" | RX:{data.rx_rate:.0f}Kbps"
         if data.download_speed is not None:
-            parts.append(f"DL:{data.download_speed:.2f}Mbps")
+            line += f" | DL:{data.download_speed:.2f}Mbps"
         if data.upload_speed is not None:
-            parts.append(f"UL:{data.upload_speed:.2f}Mbps")
+            line += f" | UL:{data.upload_speed:.2f}Mbps"
 
-        f.write(" | ".join(parts) + "\n")
-        f.flush()
+        return line
 
     def flush(self) -> None:
         """Flush all open log files."""
         with self._lock:
-            for f in self._files.values():
-                f.flush()
+            self._flush_files()
+
+    def _flush_files(self) -> None:
+        """Flush all open log files. Caller must hold _lock."""
+        # Reset first, so a failing flush isn't retried in a tight loop
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        for f in self._files.values():
+            f.flush()
 
     def close(self) -> None:
-        """Close all log files."""
+        """
+        Close all log files, writing any queued records first.
+
+        Also waits for rotated files that are still being compressed.
+        """
+        writer, q = self._writer_thread, self._queue
+        if writer is not None and q is not None:
+            # A full bounded queue only drains while the writer is alive,
+            # so never block on the sentinel if the thread has gone
+            while writer.is_alive():
+                try:
+                    q.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            writer.join()
+            self._writer_thread = None
+            self._queue = None
+
         with self._lock:
             for f in self._files.values():
                 f.close()
             self._files.clear()
             self._csv_writers.clear()
+            compress_pool = self._compress_pool
+            self._compress_pool = None
+
+        if compress_pool is not None:
+            compress_pool.shutdown(wait=True)
 
     def get_log_files(self) -> List[Path]:
         """Get list of all log files in the output directory."""
@@ -245,6 +526,11 @@ class PerformanceLogger:
         """Number of entries logged."""
         return self._entry_count
 
+    @property
+    def dropped_count(self) -> int:
+        """Number of entries dropped because the background queue was full."""
+        return self._dropped_count
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -255,198 +541,365 @@ class PerformanceLogger:
         return False
 
 
+def _csv_int(value: str) -> Any:
+    """Convert a CSV cell to int, keeping text that isn't a number."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _csv_float(value: str) -> Any:
+    """Convert a CSV cell to float, keeping text that isn't a number."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _csv_text(value: str) -> Optional[str]:
+    """Convert a CSV cell to text, with empty cells as None."""
+    return value or None
+
+
+# Values buffered per metric before folding them into _RunningStats
+_STATS_CHUNK_SIZE = 4096
+
+
+class _RunningStats:
+    """Single-pass min/max/avg accumulator for one metric."""
+
+    __slots__ = ("min", "max", "sum", "count")
+
+    def __init__(self) -> None:
+        self.min: Any = None
+        self.max: Any = None
+        self.sum = 0
+        self.count = 0
+
+    def add_many(self, values: List[Any]) -> None:
+        """Fold a chunk of values in using the builtin reductions."""
+        if not values:
+            return
+        low = min(values)
+        high = max(values)
+        if self.count:
+            if low < self.min:
+                self.min = low
+            if high > self.max:
+                self.max = high
+        else:
+            self.min = low
+            self.max = high
+        self.sum += sum(values)
+        self.count += len(values)
+
+    def merge(self, other: "_RunningStats") -> None:
+        """Fold another accumulator's statistics into this one."""
+        if not other.count:
+            return
+        if self.count:
+            if other.min < self.min:
+                self.min = other.min
+            if other.max > self.max:
+                self.max = other.max
+        else:
+            self.min = other.min
+            self.max = other.max
+        self.sum += other.sum
+        self.count += other.count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the statistics dictionary shape used by LogAnalyzer."""
+        return {
+            "min": self.min,
+            "max": self.max,
+            "avg": self.sum / self.count,
+            "samples": self.count,
+        }
+
+
+class _StatsGroup:
+    """
+    Streaming statistics for one group of records (all, or one device).
+
+    Values are collected per metric and folded into _RunningStats every
+    _STATS_CHUNK_SIZE records, so min/max/sum run as builtin reductions.
+    """
+
+    __slots__ = (
+        "metrics",
+        "timestamps",
+        "folds",
+        "pending",
+        "pending_timestamps",
+        "devices",
+        "total_entries",
+    )
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        self.metrics = {field: _RunningStats() for field in fields}
+        self.timestamps = _RunningStats()
+        # Pending values per metric, timestamps last
+        columns: List[List[Any]] = [[] for _ in range(len(self.metrics) + 1)]
+        self.pending = tuple(zip(self.metrics, columns))
+        self.pending_timestamps = columns[-1]
+        # (accumulator, pending values) pairs reduced by fold()
+        self.folds = tuple(zip([*self.metrics.values(), self.timestamps], columns))
+        self.devices: Dict[Any, None] = {}
+        self.total_entries = 0
+
+    def add(self, d: Dict[str, Any]) -> None:
+        """Add one record."""
+        self.devices[d.get("device_id")] = None
+        for field, column in self.pending:
+            value = d.get(field)
+            if value is not None:
+                column.append(value)
+        timestamp = d.get("timestamp")
+        if timestamp:
+            self.pending_timestamps.append(timestamp)
+
+        self.total_entries += 1
+        if not self.total_entries % _STATS_CHUNK_SIZE:
+            self.fold()
+
+    def fold(self) -> None:
+        """Reduce pending values into the running statistics."""
+        for accumulator, column in self.folds:
+            accumulator.add_many(column)
+            column.clear()
+
+    def merge(self, other: "_StatsGroup") -> None:
+        """Fold another (already folded) group into this one."""
+        self.total_entries += other.total_entries
+        self.devices.update(other.devices)
+        for field, accumulator in self.metrics.items():
+            accumulator.merge(other.metrics[field])
+        self.timestamps.merge(other.timestamps)
+
+    def to_dict(self, stat_metrics: Iterable[tuple]) -> Dict[str, Any]:
+        """
+        Convert to the statistics dictionary returned by LogAnalyzer.
+
+        Args:
+            stat_metrics: (statistics key, record field) pairs to include.
+
+        Returns:
+            Statistics dictionary, empty if the group has no records.
+        """
+        if not self.total_entries:
+            return {}
+
+        stats = {
+            "total_entries": self.total_entries,
+            "devices": list(self.devices),
+        }
+
+        for stat_key, field in stat_metrics:
+            accumulator = self.metrics[field]
+            if accumulator.count:
+                stats[stat_key] = accumulator.to_dict()
+
+        # Time range
+        timestamps = self.timestamps
+        if timestamps.count:
+            stats["time_range"] = {
+                "start": datetime.fromtimestamp(timestamps.min).isoformat(),
+                "end": datetime.fromtimestamp(timestamps.max).isoformat(),
+                "duration_seconds": timestamps.max - timestamps.min,
+            }
+
+        return stats
+
+
 class LogAnalyzer:
     """
     Analyzes logged WiFi performance data.
     """
 
+    # (statistics key, record field) pairs summarized by calculate_statistics
+    STAT_METRICS = (
+        ("rssi", "rssi"),
+        ("latency", "latency_avg"),
+        ("packet_loss", "packet_loss"),
+        ("download_speed", "download_speed"),
+        ("upload_speed", "upload_speed"),
+    )
+
+    # Record fields read by calculate_statistics and export_summary
+    ANALYSIS_FIELDS = ("device_id", "timestamp") + tuple(field for _, field in STAT_METRICS)
+
+    # CSV columns loaded as numbers; anything else stays text
+    INT_FIELDS = frozenset(
+        {
+            "rssi",
+            "channel",
+            "tx_packets",
+            "rx_packets",
+            "tx_bytes",
+            "rx_bytes",
+            "tx_errors",
+            "rx_errors",
+            "tx_retries",
+            "free_heap",
+            "uptime",
+            "cpu_freq",
+            "noise_floor",
+            "link_speed",
+        }
+    )
+    FLOAT_FIELDS = frozenset(
+        {
+            "snr",
+            "tx_rate",
+            "rx_rate",
+            "packet_loss",
+            "latency_min",
+            "latency_avg",
+            "latency_max",
+            "jitter",
+            "download_speed",
+            "upload_speed",
+            "timestamp",
+        }
+    )
+
     @staticmethod
-    def load_jsonl(filepath: Union[str, Path]) -> List[Dict[str, Any]]:
+    def iter_jsonl(filepath: Union[str, Path]) -> Iterator[Dict[str, Any]]:
         """
-        Load data from a JSONL file.
+        Iterate over the records of a JSONL file without loading it whole.
 
         Args:
-            filepath: Path to the JSONL file.
+            filepath: Path to the JSONL file (optionally gzipped).
 
-        Returns:
-            List of data dictionaries.
+        Yields:
+            Data dictionaries, one per line.
         """
         filepath = Path(filepath)
-        data = []
-
         opener = gzip.open if filepath.suffix == ".gz" else open
 
-        with opener(filepath, "rt", encoding="utf-8") as f:
+        with opener(filepath, "rb") as f:
             for line in f:
                 line = line.strip()
                 if line:
-                    data.append(json.loads(line))
-
-        return data
+                    yield _json_loads(line)
 
-    @staticmethod
-    def load_csv(filepath: Union[str, Path]) -> List[Dict[str, Any]]:
+    @classmethod
+    def load_jsonl(cls, filepath: Union[str, Path]) -> List[Dict[str, Any]]:
         """
-        Load data from a CSV file.
+        Load data from a JSONL file.
 
         Args:
-            filepath: Path to the CSV file.
+            filepath: Path to the JSONL file.
 
         Returns:
             List of data dictionaries.
         """
+        return list(cls.iter_jsonl(filepath))
+
+    @classmethod
+    def iter_csv(
+        cls,
+        filepath: Union[str, Path],
+        fields: Optional[Iterable[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the rows of a CSV file without loading it whole.
+
+        Args:
+            filepath: Path to the CSV file (optionally gzipped).
+            fields: Only load these columns (default: all columns).
+
+        Yields:
+            Data dictionaries with numeric fields converted, one per row.
+        """
         filepath = Path(filepath)
-        data = []
+        wanted = frozenset(fields) if fields is not None else None
 
         opener = gzip.open if filepath.suffix == ".gz" else open
 
-        with opener(filepath, "rt", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Convert numeric fields
-                for key, value in row.items():
-                    if value == "":
-                        row[key] = None
-                    elif key in (
-                        "rssi",
-                        "channel",
-                        "tx_packets",
-                        "rx_packets",
-                        "tx_bytes",
-                        "rx_bytes",
-                        "tx_errors",
-                        "rx_errors",
-                        "tx_retries",
-                        "free_heap",
-                        "uptime",
-                        "cpu_freq",
-                        "noise_floor",
-                        "link_speed",
-                    ):
-                        try:
-                            row[key] = int(value) if value else None
-                        except ValueError:
-                            pass
-                    elif key in (
-                        "snr",
-                        "tx_rate",
-                        "rx_rate",
-                        "packet_loss",
-                        "latency_min",
-                        "latency_avg",
-                        "latency_max",
-                        "jitter",
-                        "download_speed",
-                        "upload_speed",
-                        "timestamp",
-                    ):
-                        try:
-                            row[key] = float(value) if value else None
-                        except ValueError:
-                            pass
-                data.append(row)
-
-        return data
+        with opener(filepath, "rt", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            # Resolve each loaded column's converter once from the header
+            columns = []
+            for index, key in enumerate(header):
+                if wanted is not None and key not in wanted:
+                    continue
+                if key in cls.INT_FIELDS:
+                    columns.append((index, key, _csv_int))
+                elif key in cls.FLOAT_FIELDS:
+                    columns.append((index, key, _csv_float))
+                else:
+                    columns.append((index, key, _csv_text))
+
+            width = len(header)
+            for values in reader:
+                if not values:
+                    continue
+                if len(values) < width:
+                    # Missing trailing cells load as None
+                    values += [""] * (width - len(values))
+                yield {key: convert(values[index]) for index, key, convert in columns}
+
+    @classmethod
+    def load_csv(
+        cls,
+        filepath: Union[str, Path],
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Load data from a CSV file.
+
+        Args:
+            filepath: Path to the CSV file.
+            fields: Only load these columns (default: all columns).
+
+        Returns:
+            List of data dictionaries.
+        """
+        return list(cls.iter_csv(filepath, fields))
 
     @classmethod
     def calculate_statistics(
         cls,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         device_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Calculate statistics from logged data.
 
+        Works in a single pass, so `data` may be a generator such as
+        iter_jsonl() and is never held in memory. Values are collected in
+        chunks of _STATS_CHUNK_SIZE records and reduced with min/max/sum.
+
         Args:
-            data: List of data dictionaries.
+            data: Iterable of data dictionaries.
             device_id: Filter by device ID (optional).
 
         Returns:
             Statistics dictionary.
         """
-        if device_id:
-            data = [d for d in data if d.get("device_id") == device_id]
-
-        if not data:
-            return {}
-
-        stats = {
-            "total_entries": len(data),
-            "devices": list(set(d.get("device_id") for d in data)),
-        }
-
-        # Calculate RSSI stats
-        rssi_values = [d["rssi"] for d in data if d.get("rssi") is not None]
-        if rssi_values:
-            stats["rssi"] = {
-                "min": min(rssi_values),
-                "max": max(rssi_values),
-                "avg": sum(rssi_values) / len(rssi_values),
-                "samples": len(rssi_values),
-            }
-
-        # Calculate latency stats
-        latency_values = [
-            d["latency_avg"] for d in data if d.get("latency_avg") is not None
-        ]
-        if latency_values:
-            stats["latency"] = {
-                "min": min(latency_values),
-                "max": max(latency_values),
-                "avg": sum(latency_values) / len(latency_values),
-                "samples": len(latency_values),
-            }
-
-        # Calculate packet loss stats
-        loss_values = [
-            d["packet_loss"] for d in data if d.get("packet_loss") is not None
-        ]
-        if loss_values:
-            stats["packet_loss"] = {
-                "min": min(loss_values),
-                "max": max(loss_values),
-                "avg": sum(loss_values) / len(loss_values),
-                "samples": len(loss_values),
-            }
-
-        # Calculate throughput stats
-        dl_values = [
-            d["download_speed"] for d in data if d.get("download_speed") is not None
-        ]
-        if dl_values:
-            stats["download_speed"] = {
-                "min": min(dl_values),
-                "max": max(dl_values),
-                "avg": sum(dl_values) / len(dl_values),
-                "samples": len(dl_values),
-            }
-
-        ul_values = [
-            d["upload_speed"] for d in data if d.get("upload_speed") is not None
-        ]
-        if ul_values:
-            stats["upload_speed"] = {
-                "min": min(ul_values),
-                "max": max(ul_values),
-                "avg": sum(ul_values) / len(ul_values),
-                "samples": len(ul_values),
-            }
-
-        # Time range
-        timestamps = [d["timestamp"] for d in data if d.get("timestamp")]
-        if timestamps:
-            stats["time_range"] = {
-                "start": datetime.fromtimestamp(min(timestamps)).isoformat(),
-                "end": datetime.fromtimestamp(max(timestamps)).isoformat(),
-                "duration_seconds": max(timestamps) - min(timestamps),
-            }
-
-        return stats
+        group = _StatsGroup(field for _, field in cls.STAT_METRICS)
+        for d in data:
+            if device_id and d.get("device_id") != device_id:
+                continue
+            group.add(d)
+        group.fold()
+        return group.to_dict(cls.STAT_METRICS)
 
     @classmethod
     def export_summary(
         cls,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         output_path: Union[str, Path],
         format: str = "json",
     ) -> None:
@@ -454,21 +907,34 @@ class LogAnalyzer:
         Export a summary report.
 
         Args:
-            data: List of data dictionaries.
+            data: Iterable of data dictionaries, read once.
             output_path: Output file path.
             format: Output format ('json' or 'text').
         """
         output_path = Path(output_path)
 
-        # Get unique devices
-        devices = list(set(d.get("device_id") for d in data if d.get("device_id")))
-
-        summary = {
+        # One pass grouped by device; the overall figures are the merged groups
+        fields = [field for _, field in cls.STAT_METRICS]
+        groups: Dict[Any, _StatsGroup] = {}
+        for d in data:
+            device_id = d.get("device_id")
+            group = groups.get(device_id)
+            if group is None:
+                group = groups[device_id] = _StatsGroup(fields)
+            group.add(d)
+
+        overall = _StatsGroup(fields)
+        for group in groups.values():
+            group.fold()
+            overall.merge(group)
+
+        summary: Dict[str, Any] = {
             "generated_at": datetime.now().isoformat(),
-            "overall": cls.calculate_statistics(data),
+            "overall": overall.to_dict(cls.STAT_METRICS),
             "per_device": {
-                device_id: cls.calculate_statistics(data, device_id)
-                for device_id in devices
+                device_id: group.to_dict(cls.STAT_METRICS)
+                for device_id, group in groups.items()
+                if device_id
             },
         }
 
@@ -481,28 +947,28 @@ class LogAnalyzer:
                 f.write("=" * 50 + "\n\n")
                 f.write(f"Generated: {summary['generated_at']}\n\n")
 
-                overall = summary["overall"]
+                overall_summary = summary["overall"]
                 f.write("Overall Statistics:\n")
-                f.write(f"  Total Entries: {overall.get('total_entries', 0)}\n")
-                f.write(f"  Devices: {', '.join(overall.get('devices', []))}\n")
+                f.write(f"  Total Entries: {overall_summary.get('total_entries', 0)}\n")
+                f.write(f"  Devices: {', '.join(overall_summary.get('devices', []))}\n")
 
-                if "rssi" in overall:
+                if "rssi" in overall_summary:
                     f.write(f"\n  RSSI:\n")
-                    f.write(f"    Min: {overall['rssi']['min']} dBm\n")
-                    f.write(f"    Max: {overall['rssi']['max']} dBm\n")
-                    f.write(f"    Avg: {overall['rssi']['avg']:.1f} dBm\n")
+                    f.write(f"    Min: {overall_summary['rssi']['min']} dBm\n")
+                    f.write(f"    Max: {overall_summary['rssi']['max']} dBm\n")
+                    f.write(f"    Avg: {overall_summary['rssi']['avg']:.1f} dBm\n")
 
-                if "latency" in overall:
+                if "latency" in overall_summary:
                     f.write(f"\n  Latency:\n")
-                    f.write(f"    Min: {overall['latency']['min']:.1f} ms\n")
-                    f.write(f"    Max: {overall['latency']['max']:.1f} ms\n")
-                    f.write(f"    Avg: {overall['latency']['avg']:.1f} ms\n")
+                    f.write(f"    Min: {overall_summary['latency']['min']:.1f} ms\n")
+                    f.write(f"    Max: {overall_summary['latency']['max']:.1f} ms\n")
+                    f.write(f"    Avg: {overall_summary['latency']['avg']:.1f} ms\n")
 
-                if "packet_loss" in overall:
+                if "packet_loss" in overall_summary:
                     f.write(f"\n  Packet Loss:\n")
-                    f.write(f"    Min: {overall['packet_loss']['min']:.2f}%\n")
-                    f.write(f"    Max: {overall['packet_loss']['max']:.2f}%\n")
-                    f.write(f"    Avg: {overall['packet_loss']['avg']:.2f}%\n")
+                    f.write(f"    Min: {overall_summary['packet_loss']['min']:.2f}%\n")
+                    f.write(f"    Max: {overall_summary['packet_loss']['max']:.2f}%\n")
+                    f.write(f"    Avg: {overall_summary['packet_loss']['avg']:.2f}%\n")
 
                 f.write("\n" + "=" * 50 + "\n")
                 f.write("Per-Device Statistics:\n")
@@ -4,13 +4,21 @@ ESP32 Device Manager
 Manages multiple ESP32 device connections simultaneously.
 """
 
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .device import DeviceInfo, ESP32Device
 
+# Upper bound on threads used to talk to devices concurrently
+_MAX_IO_WORKERS = 32
+
+# Longest wait between reconnect attempts for a device that stays unplugged
+_MAX_RECONNECT_BACKOFF = 60.0
+
 
 @dataclass
 class DeviceStatus:
@@ -42,17 +50,21 @@ class ESP32Manager:
 
         Args:
             auto_reconnect: Automatically reconnect to disconnected devices.
-            reconnect_interval: Seconds between reconnection attempts.
+            reconnect_interval: Seconds between reconnection attempts. Each
+                failed attempt doubles a device's delay, up to 60 seconds.
         """
         self.auto_reconnect = auto_reconnect
         self.reconnect_interval = reconnect_interval
 
+        # Replaced (never mutated) under _lock so readers can iterate lock-free
         self._devices: Dict[str, ESP32Device] = {}
         self._device_status: Dict[str, DeviceStatus] = {}
-        self._global_callbacks: list[Callable[[str, str], None]] = []
+        # Shared by reference with every device; replaced, never mutated
+        self._global_callbacks: tuple[Callable[[str, str], None], ...] = ()
         self._lock = threading.Lock()
         self._monitor_thread: Optional[threading.Thread] = None
         self._running = False
+        self._stop_event = threading.Event()
 
     def discover_and_connect(
         self,
@@ -74,17 +86,12 @@ class ESP32Manager:
         if device_filter:
             devices = [d for d in devices if device_filter(d)]
 
-        connected_ids = []
-        for device_info in devices:
-            device_id = self.add_device(
-                port=device_info.port,
-                device_id=device_info.device_id,
-                baud_rate=baud_rate,
-            )
-            if device_id:
-                connected_ids.append(device_id)
-
-        return connected_ids
+        results = self.add_devices(
+            [d.port for d in devices],
+            device_ids=[d.device_id for d in devices],
+            baud_rate=baud_rate,
+        )
+        return [device_id for device_id in results if device_id]
 
     def add_device(
         self,
@@ -112,21 +119,53 @@ class ESP32Manager:
         if not device.connect():
             return None
 
-        # Add global callbacks
-        for callback in self._global_callbacks:
-            device.add_callback(callback)
-
+        status = DeviceStatus(
+            device_id=device.device_id,
+            port=port,
+            connected=True,
+            reading=False,
+        )
         with self._lock:
-            self._devices[device.device_id] = device
-            self._device_status[device.device_id] = DeviceStatus(
-                device_id=device.device_id,
-                port=port,
-                connected=True,
-                reading=False,
-            )
+            device.set_global_callbacks(self._global_callbacks)
+            self._devices = {**self._devices, device.device_id: device}
+            self._device_status = {**self._device_status, device.device_id: status}
 
         return device.device_id
 
+    def add_devices(
+        self,
+        ports: List[str],
+        device_ids: Optional[List[Optional[str]]] = None,
+        baud_rate: int = 115200,
+    ) -> List[Optional[str]]:
+        """
+        Add and connect to several devices in parallel.
+
+        Each connect waits for the port to settle, so connecting
+        concurrently keeps start-up time flat as devices are added.
+
+        Args:
+            ports: Serial port paths.
+            device_ids: Custom identifiers matching ports, or None.
+            baud_rate: Serial baud rate.
+
+        Returns:
+            Device ID (or None on failure) for each port, in order.
+        """
+        if not ports:
+            return []
+        if device_ids is None:
+            device_ids = [None] * len(ports)
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(ports))) as executor:
+            return list(
+                executor.map(
+                    lambda port, device_id: self.add_device(port, device_id, baud_rate),
+                    ports,
+                    device_ids,
+                )
+            )
+
     def remove_device(self, device_id: str) -> bool:
         """
         Disconnect and remove a device.
@@ -138,8 +177,12 @@ class ESP32Manager:
             True if device was found and removed.
         """
         with self._lock:
-            device = self._devices.pop(device_id, None)
-            self._device_status.pop(device_id, None)
+            device = self._devices.get(device_id)
+            if device:
+                self._devices = {k: v for k, v in self._devices.items() if k != device_id}
+                self._device_status = {
+                    k: v for k, v in self._device_status.items() if k != device_id
+                }
 
         if device:
             device.disconnect()
@@ -182,10 +225,17 @@ class ESP32Manager:
 
     def stop_reading_all(self) -> None:
         """Stop reading from all devices."""
-        for device_id, device in self._devices.items():
+        devices = self._devices
+        device_status = self._device_status
+
+        # Signal every reader first so their read timeouts elapse concurrently
+        for device in devices.values():
+            device.stop_reading(wait=False)
+
+        for device_id, device in devices.items():
             device.stop_reading()
-            if device_id in self._device_status:
-                self._device_status[device_id].reading = False
+            if device_id in device_status:
+                device_status[device_id].reading = False
 
     def add_global_callback(self, callback: Callable[[str, str], None]) -> None:
         """
@@ -194,16 +244,22 @@ class ESP32Manager:
         Args:
             callback: Function(device_id, line) called for each data line.
         """
-        self._global_callbacks.append(callback)
-        for device in self._devices.values():
-            device.add_callback(callback)
+        with self._lock:
+            self._set_global_callbacks(self._global_callbacks + (callback,))
 
     def remove_global_callback(self, callback: Callable[[str, str], None]) -> None:
         """Remove a global callback."""
-        if callback in self._global_callbacks:
-            self._global_callbacks.remove(callback)
-            for device in self._devices.values():
-                device.remove_callback(callback)
+        with self._lock:
+            if callback in self._global_callbacks:
+                callbacks = list(self._global_callbacks)
+                callbacks.remove(callback)
+                self._set_global_callbacks(tuple(callbacks))
+
+    def _set_global_callbacks(self, callbacks: tuple) -> None:
+        """Replace the global callbacks on the manager and every device. Caller holds _lock."""
+        self._global_callbacks = callbacks
+        for device in self._devices.values():
+            device.set_global_callbacks(callbacks)
 
     def broadcast_command(self, command: str) -> Dict[str, bool]:
         """
@@ -215,10 +271,27 @@ class ESP32Manager:
         Returns:
             Dictionary mapping device_id to success status.
         """
-        results = {}
-        for device_id, device in self._devices.items():
-            results[device_id] = device.send_command(command)
-        return results
+        return self._for_each_device(lambda device: device.send_command(command))
+
+    def _for_each_device(self, func: Callable[[ESP32Device], bool]) -> Dict[str, bool]:
+        """
+        Run func on every device, concurrently when there is more than one.
+
+        Serial writes block until the data is sent, so fanning out keeps a
+        broadcast as fast as the slowest single device.
+
+        Returns:
+            Dictionary mapping device_id to func's result.
+        """
+        devices = self._devices
+        if len(devices) <= 1:
+            return {device_id: func(device) for device_id, device in devices.items()}
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(devices))) as executor:
+            futures = {
+                device_id: executor.submit(func, device) for device_id, device in devices.items()
+            }
+            return {device_id: future.result() for device_id, future in futures.items()}
 
     def trigger_all_performance_reports(self) -> Dict[str, bool]:
         """Request performance reports from all devices."""
@@ -240,9 +313,12 @@ class ESP32Manager:
             enable: Whether to enable continuous reporting.
             interval_ms: Reporting interval in milliseconds.
         """
-        for device in self._devices.values():
+
+        def configure(device: ESP32Device) -> bool:
             device.set_report_interval(interval_ms)
-            device.enable_continuous_reporting(enable)
+            return device.enable_continuous_reporting(enable)
+
+        self._for_each_device(configure)
 
     def start_monitoring(self) -> None:
         """Start background monitoring for device health and auto-reconnect."""
@@ -250,6 +326,7 @@ class ESP32Manager:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._monitor_thread = threading.Thread(
             target=self._monitor_loop, daemon=True, name="ESP32Monitor"
         )
@@ -258,39 +335,66 @@ class ESP32Manager:
     def stop_monitoring(self) -> None:
         """Stop background monitoring."""
         self._running = False
+        self._stop_event.set()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=2.0)
             self._monitor_thread = None
 
     def _monitor_loop(self) -> None:
-        """Background loop for device health monitoring."""
-        while self._running:
-            # Check for disconnected devices
-            for device_id, device in list(self._devices.items()):
-                if not device.is_connected:
-                    if device_id in self._device_status:
-                        self._device_status[device_id].connected = False
+        """
+        Background loop for device health monitoring.
 
-                    if self.auto_reconnect:
-                        # Attempt reconnect
-                        if device.connect():
-                            device.start_reading()
-                            if device_id in self._device_status:
-                                self._device_status[device_id].connected = True
-                                self._device_status[device_id].reading = True
+        A device that fails to reconnect is retried with exponential backoff
+        (plus jitter, so several unplugged devices don't retry in lockstep).
+        """
+        # device_id -> (current delay, monotonic time of next attempt)
+        backoff: Dict[str, Tuple[float, float]] = {}
+
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            device_status = self._device_status
 
-            time.sleep(self.reconnect_interval)
+            # Check for disconnected devices
+            for device_id, device in self._devices.items():
+                if device.is_connected:
+                    continue
+                status = device_status.get(device_id)
+                if status:
+                    status.connected = False
+
+                if not self.auto_reconnect:
+                    continue
+                delay, next_attempt = backoff.get(device_id, (0.0, 0.0))
+                if now < next_attempt:
+                    continue
+
+                # Attempt reconnect
+                if device.connect():
+                    backoff.pop(device_id, None)
+                    device.start_reading()
+                    if status:
+                        status.connected = True
+                        status.reading = True
+                else:
+                    delay = min(_MAX_RECONNECT_BACKOFF, max(self.reconnect_interval, delay * 2))
+                    backoff[device_id] = (delay, now + delay + random.uniform(0, delay / 10))
+                    if status:
+                        status.error_count += 1
+
+            self._stop_event.wait(self.reconnect_interval)
 
     def disconnect_all(self) -> None:
         """Disconnect from all devices."""
         self.stop_monitoring()
         self.stop_reading_all()
 
-        for device in list(self._devices.values()):
-            device.disconnect()
+        with self._lock:
+            devices = self._devices
+            self._devices = {}
+            self._device_status = {}
 
-        self._devices.clear()
-        self._device_status.clear()
+        for device in devices.values():
+            device.disconnect()
 
     @property
     def device_count(self) -> int:
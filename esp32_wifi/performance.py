@@ -6,11 +6,112 @@ Parses and structures WiFi performance data from ESP32 devices.
 
 import json
 import re
+import sys
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Key-value tokenizer: rssi=-45, ssid=MyNetwork
+_KV_RE = re.compile(r"(\w+)\s*[=:]\s*([^,\|]+)")
+_KV_FINDALL = _KV_RE.findall
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _to_int(value: Any) -> int:
+    """Convert a reported number to int, accepting values like "-45.0"."""
+    return int(float(value))
+
+
+# Type converter for each standard field name
+_FIELD_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    # String fields
+    "ssid": str,
+    "bssid": str,
+    # Integer fields
+    "rssi": _to_int,
+    "channel": _to_int,
+    "link_speed": _to_int,
+    "tx_packets": _to_int,
+    "rx_packets": _to_int,
+    "tx_bytes": _to_int,
+    "rx_bytes": _to_int,
+    "tx_errors": _to_int,
+    "rx_errors": _to_int,
+    "tx_retries": _to_int,
+    "free_heap": _to_int,
+    "uptime": _to_int,
+    "cpu_freq": _to_int,
+    "noise_floor": _to_int,
+    # Float fields
+    "snr": float,
+    "tx_rate": float,
+    "rx_rate": float,
+    "packet_loss": float,
+    "latency_min": float,
+    "latency_avg": float,
+    "latency_max": float,
+    "jitter": float,
+    "download_speed": float,
+    "upload_speed": float,
+}
+
+
+def _signal_strength(rssi: Optional[int]) -> str:
+    """Human-readable signal strength for an RSSI in dBm."""
+    if rssi is None:
+        return "Unknown"
+    if rssi >= -50:
+        return "Excellent"
+    elif rssi >= -60:
+        return "Good"
+    elif rssi >= -70:
+        return "Fair"
+    elif rssi >= -80:
+        return "Weak"
+    else:
+        return "Poor"
+
+
+# Second and ISO text of the last timestamp formatted by _isoformat()
+_iso_cache: Tuple[Optional[int], str] = (None, "")
+
+
+def _isoformat(timestamp: float) -> str:
+    """
+    Same as datetime.fromtimestamp(timestamp).isoformat().
+
+    The date and time are only formatted once per wall-clock second, which
+    data points arriving in the same second share.
+    """
+    global _iso_cache
+    if timestamp < 0:
+        return datetime.fromtimestamp(timestamp).isoformat()
+    second = int(timestamp)
+    # Round half-even to microseconds, as datetime.fromtimestamp() does
+    micros = round((timestamp - second) * 1e6)
+    if micros == 1000000:
+        second += 1
+        micros = 0
+    cached = _iso_cache
+    if cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second).isoformat())
+        _iso_cache = cached
+    if micros:
+        return f"{cached[1]}.{micros:06d}"
+    return cached[1]
 
 
 class ConnectionStatus(Enum):
@@ -22,7 +123,20 @@ class ConnectionStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Reported status values (lowercased); anything else means disconnected
+_STATUS_MAP = {
+    "connected": ConnectionStatus.CONNECTED,
+    "1": ConnectionStatus.CONNECTED,
+    "true": ConnectionStatus.CONNECTED,
+    "connecting": ConnectionStatus.CONNECTING,
+    "2": ConnectionStatus.CONNECTING,
+    "failed": ConnectionStatus.FAILED,
+    "-1": ConnectionStatus.FAILED,
+    "error": ConnectionStatus.FAILED,
+}
+
+
+@dataclass(**_SLOTS)
 class WiFiPerformanceData:
     """
     WiFi performance metrics from an ESP32 device.
@@ -75,24 +189,13 @@ class WiFiPerformanceData:
     uptime: Optional[int] = None  # seconds
     cpu_freq: Optional[int] = None  # MHz
 
-    # Raw data for custom parsing
+    # Raw data for custom parsing (only kept when parsed with keep_raw=True)
     raw_data: Optional[str] = None
 
     @property
     def signal_strength(self) -> str:
         """Human-readable signal strength."""
-        if self.rssi is None:
-            return "Unknown"
-        if self.rssi >= -50:
-            return "Excellent"
-        elif self.rssi >= -60:
-            return "Good"
-        elif self.rssi >= -70:
-            return "Fair"
-        elif self.rssi >= -80:
-            return "Weak"
-        else:
-            return "Poor"
+        return _signal_strength(self.rssi)
 
     @property
     def datetime(self) -> datetime:
@@ -101,16 +204,17 @@ class WiFiPerformanceData:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        # Derived values are computed inline rather than through the properties
         return {
             "device_id": self.device_id,
             "timestamp": self.timestamp,
-            "datetime": self.datetime.isoformat(),
+            "datetime": _isoformat(self.timestamp),
             "ssid": self.ssid,
             "bssid": self.bssid,
             "channel": self.channel,
             "status": self.status.value,
             "rssi": self.rssi,
-            "signal_strength": self.signal_strength,
+            "signal_strength": _signal_strength(self.rssi),
             "snr": self.snr,
             "noise_floor": self.noise_floor,
             "tx_rate": self.tx_rate,
@@ -137,6 +241,11 @@ class WiFiPerformanceData:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(self.to_dict()).decode("utf-8")
+            except TypeError:
+                pass  # orjson only encodes integers up to 64 bits
         return json.dumps(self.to_dict())
 
 
@@ -146,107 +255,116 @@ class PerformanceParser:
 
     Supports multiple data formats:
     - JSON format
+    - Pipe-delimited reports (PERF|KEY:VALUE|...)
     - Key-value format (KEY:VALUE or KEY=VALUE)
-    - CSV format
     """
 
     # Regex patterns for different data formats
     PATTERNS = {
-        # JSON format: {"rssi": -45, "ssid": "MyNetwork", ...}
-        "json": re.compile(r"^\s*\{.*\}\s*$"),
-        # Performance report format: PERF|rssi:-45|ssid:MyNetwork|...
-        "pipe_delimited": re.compile(r"^PERF\|(.+)$"),
         # Key-value format: rssi=-45, ssid=MyNetwork
-        "key_value": re.compile(r"(\w+)\s*[=:]\s*([^,\|]+)"),
-        # CSV format: device_id,rssi,ssid,channel,...
-        "csv": re.compile(r"^[^,]+(?:,[^,]+)+$"),
+        "key_value": _KV_RE,
     }
 
-    # Field mappings from various names to our standard names
-    FIELD_MAPPINGS = {
-        # RSSI variations
-        "rssi": "rssi",
-        "signal": "rssi",
-        "signal_strength": "rssi",
-        "wifi_rssi": "rssi",
-        # SSID variations
-        "ssid": "ssid",
-        "network": "ssid",
-        "wifi_ssid": "ssid",
-        # Channel
-        "channel": "channel",
-        "chan": "channel",
-        "ch": "channel",
-        # BSSID
-        "bssid": "bssid",
-        "mac": "bssid",
-        "ap_mac": "bssid",
-        # Throughput
-        "tx_rate": "tx_rate",
-        "txrate": "tx_rate",
-        "tx_speed": "tx_rate",
-        "rx_rate": "rx_rate",
-        "rxrate": "rx_rate",
-        "rx_speed": "rx_rate",
-        "link_speed": "link_speed",
-        "linkspeed": "link_speed",
-        "speed": "link_speed",
-        # Packets
-        "tx_packets": "tx_packets",
-        "txpkt": "tx_packets",
-        "rx_packets": "rx_packets",
-        "rxpkt": "rx_packets",
-        "tx_bytes": "tx_bytes",
-        "txbytes": "tx_bytes",
-        "rx_bytes": "rx_bytes",
-        "rxbytes": "rx_bytes",
-        "tx_errors": "tx_errors",
-        "txerr": "tx_errors",
-        "rx_errors": "rx_errors",
-        "rxerr": "rx_errors",
-        "tx_retries": "tx_retries",
-        "retries": "tx_retries",
-        "packet_loss": "packet_loss",
-        "loss": "packet_loss",
-        "ploss": "packet_loss",
-        # Latency
-        "latency": "latency_avg",
-        "latency_avg": "latency_avg",
-        "ping": "latency_avg",
-        "rtt": "latency_avg",
-        "latency_min": "latency_min",
-        "ping_min": "latency_min",
-        "latency_max": "latency_max",
-        "ping_max": "latency_max",
-        "jitter": "jitter",
-        # Speed test
-        "download": "download_speed",
-        "download_speed": "download_speed",
-        "dl_speed": "download_speed",
-        "upload": "upload_speed",
-        "upload_speed": "upload_speed",
-        "ul_speed": "upload_speed",
-        # Device info
-        "heap": "free_heap",
-        "free_heap": "free_heap",
-        "freemem": "free_heap",
-        "uptime": "uptime",
-        "cpu_freq": "cpu_freq",
-        "freq": "cpu_freq",
-        # SNR
-        "snr": "snr",
-        "noise": "noise_floor",
-        "noise_floor": "noise_floor",
+    # Field mappings from various names to our standard names. Read-only:
+    # the parser resolves keys through _FIELD_DISPATCH, built from it once.
+    FIELD_MAPPINGS = MappingProxyType(
+        {
+            # RSSI variations
+            "rssi": "rssi",
+            "signal": "rssi",
+            "signal_strength": "rssi",
+            "wifi_rssi": "rssi",
+            # SSID variations
+            "ssid": "ssid",
+            "network": "ssid",
+            "wifi_ssid": "ssid",
+            # Channel
+            "channel": "channel",
+            "chan": "channel",
+            "ch": "channel",
+            # BSSID
+            "bssid": "bssid",
+            "mac": "bssid",
+            "ap_mac": "bssid",
+            # Throughput
+            "tx_rate": "tx_rate",
+            "txrate": "tx_rate",
+            "tx_speed": "tx_rate",
+            "rx_rate": "rx_rate",
+            "rxrate": "rx_rate",
+            "rx_speed": "rx_rate",
+            "link_speed": "link_speed",
+            "linkspeed": "link_speed",
+            "speed": "link_speed",
+            # Packets
+            "tx_packets": "tx_packets",
+            "txpkt": "tx_packets",
+            "rx_packets": "rx_packets",
+            "rxpkt": "rx_packets",
+            "tx_bytes": "tx_bytes",
+            "txbytes": "tx_bytes",
+            "rx_bytes": "rx_bytes",
+            "rxbytes": "rx_bytes",
+            "tx_errors": "tx_errors",
+            "txerr": "tx_errors",
+            "rx_errors": "rx_errors",
+            "rxerr": "rx_errors",
+            "tx_retries": "tx_retries",
+            "retries": "tx_retries",
+            "packet_loss": "packet_loss",
+            "loss": "packet_loss",
+            "ploss": "packet_loss",
+            # Latency
+            "latency": "latency_avg",
+            "latency_avg": "latency_avg",
+            "ping": "latency_avg",
+            "rtt": "latency_avg",
+            "latency_min": "latency_min",
+            "ping_min": "latency_min",
+            "latency_max": "latency_max",
+            "ping_max": "latency_max",
+            "jitter": "jitter",
+            # Speed test
+            "download": "download_speed",
+            "download_speed": "download_speed",
+            "dl_speed": "download_speed",
+            "upload": "upload_speed",
+            "upload_speed": "upload_speed",
+            "ul_speed": "upload_speed",
+            # Device info
+            "heap": "free_heap",
+            "free_heap": "free_heap",
+            "freemem": "free_heap",
+            "uptime": "uptime",
+            "cpu_freq": "cpu_freq",
+            "freq": "cpu_freq",
+            # SNR
+            "snr": "snr",
+            "noise": "noise_floor",
+            "noise_floor": "noise_floor",
+        }
+    )
+
+    # Raw key -> (standard field name, converter), resolved once per key
+    _FIELD_DISPATCH: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+        raw_key: (name, _FIELD_CONVERTERS[name]) for raw_key, name in FIELD_MAPPINGS.items()
     }
 
     @classmethod
-    def parse(cls, device_id: str, line: str) -> Optional[WiFiPerformanceData]:
+    def parse(
+        cls,
+        device_id: str,
+        line: str,
+        keep_raw: bool = False,
+    ) -> Optional[WiFiPerformanceData]:
         """
         Parse a line of performance data.
 
         Args:
             device_id: ID of the device that sent this data.
             line: Raw data line to parse.
+            keep_raw: Store the line in raw_data. Off by default, since it
+                roughly doubles the memory held per data point.
 
         Returns:
             WiFiPerformanceData object or None if parsing failed.
@@ -255,29 +373,39 @@ class PerformanceParser:
         if not line:
             return None
 
-        # Try JSON format first
-        if cls.PATTERNS["json"].match(line):
-            return cls._parse_json(device_id, line)
+        # JSON format: {"rssi": -45, "ssid": "MyNetwork", ...}
+        if line[0] == "{" and line[-1] == "}":
+            return cls._parse_json(device_id, line, keep_raw)
 
-        # Try pipe-delimited format
-        match = cls.PATTERNS["pipe_delimited"].match(line)
-        if match:
-            return cls._parse_key_value(device_id, match.group(1), delimiter="|")
+        # Performance report format: PERF|rssi:-45|ssid:MyNetwork|...
+        if line.startswith("PERF|") and len(line) > 5:
+            return cls._parse_key_value(device_id, line[5:], delimiter="|", keep_raw=keep_raw)
 
         # Try key-value format
         if "=" in line or ":" in line:
-            return cls._parse_key_value(device_id, line)
+            return cls._parse_key_value(device_id, line, keep_raw=keep_raw)
 
         return None
 
     @classmethod
-    def _parse_json(cls, device_id: str, line: str) -> Optional[WiFiPerformanceData]:
+    def _parse_json(
+        cls,
+        device_id: str,
+        line: str,
+        keep_raw: bool = False,
+    ) -> Optional[WiFiPerformanceData]:
         """Parse JSON formatted data."""
         try:
-            data = json.loads(line)
-            return cls._build_performance_data(device_id, data, line)
+            data = orjson.loads(line) if orjson is not None else json.loads(line)
         except json.JSONDecodeError:
-            return None
+            if orjson is None:
+                return None
+            # orjson rejects NaN/Infinity and integers beyond 64 bits; json doesn't
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                return None
+        return cls._build_performance_data(device_id, data, line if keep_raw else None)
 
     @classmethod
     def _parse_key_value(
@@ -285,23 +413,30 @@ class PerformanceParser:
         device_id: str,
         line: str,
         delimiter: str = ",",
+        keep_raw: bool = False,
     ) -> Optional[WiFiPerformanceData]:
         """Parse key-value formatted data."""
         data = {}
 
-        # Split by delimiter first if not comma
+        # A value never spans a comma or pipe, so each field can be split out
+        # and partitioned; the regex is only needed for irregular fields.
+        fields = line.split(delimiter)
         if delimiter != ",":
-            parts = line.split(delimiter)
-        else:
-            parts = [line]
-
-        for part in parts:
-            matches = cls.PATTERNS["key_value"].findall(part)
-            for key, value in matches:
+            fields = [f for part in fields for f in part.split(",")]
+
+        for text in fields:
+            key, sep, value = text.partition("=")
+            if not sep:
+                key, sep, value = text.partition(":")
+            key = key.strip()
+            if value and "|" not in value and (key.isalnum() or key.replace("_", "a").isalnum()):
                 data[key.lower()] = value.strip()
+            else:
+                for key, value in _KV_FINDALL(text):
+                    data[key.lower()] = value.strip()
 
         if data:
-            return cls._build_performance_data(device_id, data, line)
+            return cls._build_performance_data(device_id, data, line if keep_raw else None)
         return None
 
     @classmethod
@@ -309,101 +444,59 @@ class PerformanceParser:
         cls,
         device_id: str,
         data: Dict[str, Any],
-        raw_line: str,
+        raw_line: Optional[str],
     ) -> WiFiPerformanceData:
         """Build WiFiPerformanceData from parsed data dictionary."""
         perf = WiFiPerformanceData(device_id=device_id, raw_data=raw_line)
 
+        dispatch = cls._FIELD_DISPATCH
         for raw_key, value in data.items():
-            normalized_key = cls.FIELD_MAPPINGS.get(raw_key.lower())
-            if normalized_key and hasattr(perf, normalized_key):
+            # Keys are almost always lowercase already; only fold case on a miss
+            target = dispatch.get(raw_key)
+            if target is None:
+                target = dispatch.get(raw_key.lower())
+                if target is None:
+                    continue
+            name, convert = target
+            if value is not None:
                 try:
-                    # Convert value to appropriate type
-                    converted = cls._convert_value(normalized_key, value)
-                    setattr(perf, normalized_key, converted)
+                    value = convert(value)
                 except (ValueError, TypeError):
-                    pass  # Skip invalid values
+                    continue  # Skip invalid values
+            setattr(perf, name, value)
 
         # Handle status field specially
         if "status" in data:
-            status_val = str(data["status"]).lower()
-            if status_val in ["connected", "1", "true"]:
-                perf.status = ConnectionStatus.CONNECTED
-            elif status_val in ["connecting", "2"]:
-                perf.status = ConnectionStatus.CONNECTING
-            elif status_val in ["failed", "-1", "error"]:
-                perf.status = ConnectionStatus.FAILED
-            else:
-                perf.status = ConnectionStatus.DISCONNECTED
+            perf.status = _STATUS_MAP.get(
+                str(data["status"]).lower(), ConnectionStatus.DISCONNECTED
+            )
 
         return perf
 
-    @classmethod
-    def _convert_value(cls, field_name: str, value: Any) -> Any:
-        """Convert a value to the appropriate type for a field."""
-        if value is None:
-            return None
-
-        # String fields
-        if field_name in ("ssid", "bssid"):
-            return str(value)
-
-        # Integer fields
-        int_fields = (
-            "rssi",
-            "channel",
-            "link_speed",
-            "tx_packets",
-            "rx_packets",
-            "tx_bytes",
-            "rx_bytes",
-            "tx_errors",
-            "rx_errors",
-            "tx_retries",
-            "free_heap",
-            "uptime",
-            "cpu_freq",
-            "noise_floor",
-        )
-        if field_name in int_fields:
-            return int(float(value))
-
-        # Float fields
-        float_fields = (
-            "snr",
-            "tx_rate",
-            "rx_rate",
-            "packet_loss",
-            "latency_min",
-            "latency_avg",
-            "latency_max",
-            "jitter",
-            "download_speed",
-            "upload_speed",
-        )
-        if field_name in float_fields:
-            return float(value)
-
-        return value
-
 
 class PerformanceMonitor:
     """
     Monitors and aggregates WiFi performance data from multiple devices.
     """
 
-    def __init__(self, history_size: int = 1000):
+    def __init__(self, history_size: int = 1000, keep_raw: bool = False):
         """
         Initialize the performance monitor.
 
         Args:
             history_size: Maximum number of data points to keep per device.
+            keep_raw: Keep each parsed line in the data point's raw_data.
         """
         self.history_size = history_size
-        self._history: Dict[str, List[WiFiPerformanceData]] = {}
+        self.keep_raw = keep_raw
+        self._history: Dict[str, Deque[WiFiPerformanceData]] = {}
         self._latest: Dict[str, WiFiPerformanceData] = {}
+        # device_id -> (newest data point when computed, statistics)
+        self._stats_cache: Dict[str, tuple] = {}
         self._parser = PerformanceParser()
-        self._callbacks: list = []
+        # Replaced (never mutated) under _lock so readers can iterate lock-free
+        self._callbacks: Tuple[Callable[[WiFiPerformanceData], None], ...] = ()
+        self._lock = threading.Lock()
 
     def process_line(self, device_id: str, line: str) -> Optional[WiFiPerformanceData]:
         """
@@ -416,11 +509,11 @@ class PerformanceMonitor:
         Returns:
             Parsed WiFiPerformanceData or None.
         """
-        perf_data = self._parser.parse(device_id, line)
+        perf_data = self._parser.parse(device_id, line, self.keep_raw)
         if perf_data:
             self._add_data(perf_data)
 
-            # Notify callbacks
+            # Notify callbacks, isolated so one failure doesn't skip the rest
             for callback in self._callbacks:
                 try:
                     callback(perf_data)
@@ -433,19 +526,19 @@ class PerformanceMonitor:
         """Add data point to history."""
         device_id = data.device_id
 
-        if device_id not in self._history:
-            self._history[device_id] = []
+        history = self._history.get(device_id)
+        if history is None:
+            # Bounded, so the oldest point is dropped in O(1) once full
+            history = deque(maxlen=self.history_size)
+            self._history[device_id] = history
 
-        self._history[device_id].append(data)
+        history.append(data)
         self._latest[device_id] = data
 
-        # Trim history if needed
-        if len(self._history[device_id]) > self.history_size:
-            self._history[device_id] = self._history[device_id][-self.history_size :]
-
-    def add_callback(self, callback) -> None:
+    def add_callback(self, callback: Callable[[WiFiPerformanceData], None]) -> None:
         """Add callback for new performance data."""
-        self._callbacks.append(callback)
+        with self._lock:
+            self._callbacks = self._callbacks + (callback,)
 
     def get_latest(
         self, device_id: Optional[str] = None
@@ -462,58 +555,52 @@ class PerformanceMonitor:
         limit: Optional[int] = None,
     ) -> List[WiFiPerformanceData]:
         """Get performance history for a device."""
-        history = self._history.get(device_id, [])
-        if limit:
-            return history[-limit:]
+        history = self._history.get(device_id, ())
+        if limit is not None and 0 < limit < len(history):
+            # Walk back from the newest entry rather than over the whole deque
+            return list(islice(reversed(history), limit))[::-1]
         return list(history)
 
     def get_statistics(self, device_id: str) -> Dict[str, Any]:
         """
         Calculate statistics for a device's performance history.
 
+        The result is reused until the device reports new data, so polling
+        this from a display loop doesn't rescan the whole history.
+
         Returns dict with min, max, avg for key metrics.
         """
-        history = self._history.get(device_id, [])
+        history = self._history.get(device_id)
         if not history:
             return {}
 
-        stats = {}
-
-        # Calculate stats for RSSI
-        rssi_values = [d.rssi for d in history if d.rssi is not None]
-        if rssi_values:
-            stats["rssi"] = {
-                "min": min(rssi_values),
-                "max": max(rssi_values),
-                "avg": sum(rssi_values) / len(rssi_values),
-                "count": len(rssi_values),
-            }
-
-        # Calculate stats for latency
-        latency_values = [d.latency_avg for d in history if d.latency_avg is not None]
-        if latency_values:
-            stats["latency"] = {
-                "min": min(latency_values),
-                "max": max(latency_values),
-                "avg": sum(latency_values) / len(latency_values),
-                "count": len(latency_values),
-            }
-
-        # Calculate stats for packet loss
-        loss_values = [d.packet_loss for d in history if d.packet_loss is not None]
-        if loss_values:
-            stats["packet_loss"] = {
-                "min": min(loss_values),
-                "max": max(loss_values),
-                "avg": sum(loss_values) / len(loss_values),
-                "count": len(loss_values),
-            }
-
-        return stats
+        cached = self._stats_cache.get(device_id)
+        if cached is None or cached[0] is not history[-1]:
+            # Snapshot first: a deque can't be iterated while a reader appends
+            snapshot = tuple(history)
+            stats = {}
+            for name, values in (
+                ("rssi", [d.rssi for d in snapshot if d.rssi is not None]),
+                ("latency", [d.latency_avg for d in snapshot if d.latency_avg is not None]),
+                ("packet_loss", [d.packet_loss for d in snapshot if d.packet_loss is not None]),
+            ):
+                if values:
+                    stats[name] = {
+                        "min": min(values),
+                        "max": max(values),
+                        "avg": sum(values) / len(values),
+                        "count": len(values),
+                    }
+            cached = (snapshot[-1], stats)
+            self._stats_cache[device_id] = cached
+
+        return {name: dict(metric) for name, metric in cached[1].items()}
 
     def clear_history(self, device_id: Optional[str] = None) -> None:
         """Clear history for a device or all devices."""
         if device_id:
             self._history.pop(device_id, None)
+            self._stats_cache.pop(device_id, None)
         else:
             self._history.clear()
+            self._stats_cache.clear()